@@ -170,17 +170,18 @@ def format_policy_response(policy_text: str, customer_question: str = "") -> str
         return f"Error formatting policy: {str(e)}\n\nRaw policy text:\n{policy_text}"
 
 
-def run_agent(user_input: str, session_id: str = SESSION_ID, actor_id: str = ACTOR_ID):
-    """Run the agent with user input"""
+def run_agent(user_input: str, session_id: str = SESSION_ID, actor_id: str = ACTOR_ID, quiet: bool = False):
+    """Run the agent with user input (quiet=True turns off the streamed output)"""
     
     # Build tools list
     custom_tools = [retrieve, current_time, check_return_eligibility, calculate_refund_amount, format_policy_response]
     
-    # Create agent
+    # Create agent; without a callback handler nothing is printed while it runs
     agent = Agent(
         model=bedrock_model,
         tools=custom_tools,
-        system_prompt=system_prompt
+        system_prompt=system_prompt,
+        **({"callback_handler": None} if quiet else {})
     )
     
     response = agent(user_input)
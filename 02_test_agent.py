@@ -3,18 +3,19 @@ Test script for returns_refunds_agent
 Tests various customer service scenarios
 """
 
+import asyncio
 import os
 import sys
-import importlib.util
+import importlib
 
 # Set environment variable for Knowledge Base
 os.environ["KNOWLEDGE_BASE_ID"] = "XAJMXADZWS"
 
 # Import run_agent from 01_returns_refunds_agent.py using importlib
-spec = importlib.util.spec_from_file_location("returns_refunds_agent", "01_returns_refunds_agent.py")
-agent_module = importlib.util.module_from_spec(spec)
+# (import_module goes through the normal import system, so the compiled
+# bytecode in __pycache__ is reused between runs)
+agent_module = importlib.import_module("01_returns_refunds_agent")
 sys.modules["returns_refunds_agent"] = agent_module
-spec.loader.exec_module(agent_module)
 
 run_agent = agent_module.run_agent
 
@@ -24,51 +25,65 @@ def print_test_header(test_num, description):
     print(f"TEST {test_num}: {description}")
     print("="*80)
 
-def run_test(test_num, description, query):
-    """Run a single test and display results"""
+# (description, query) for each test case
+TEST_CASES = [
+    # Test 1: Current time
+    ("Current Time Check", "What time is it?"),
+    # Test 2: Return eligibility check
+    ("Return Eligibility Check",
+     "Can I return a laptop I purchased 25 days ago?"),
+    # Test 3: Refund calculation
+    ("Refund Calculation",
+     "Calculate my refund for a $500 item returned due to defect in like-new condition"),
+    # Test 4: Policy explanation
+    ("Policy Explanation",
+     "Explain the return policy for electronics in a simple way"),
+    # Test 5: Knowledge base retrieval
+    ("Knowledge Base Retrieval",
+     "Use the retrieve tool to search the knowledge base for 'Amazon return policy for electronics'"),
+]
+
+# Maximum number of agent queries in flight at once
+MAX_CONCURRENT_TESTS = 5
+
+async def run_test(semaphore, query):
+    """Run a single test query in a worker thread, returning (response, error)"""
+    async with semaphore:
+        try:
+            # quiet: concurrent runs would otherwise interleave their streamed
+            # tokens on stdout; the responses are printed in order afterwards
+            return await asyncio.to_thread(run_agent, query, quiet=True), None
+        except Exception as e:
+            return None, e
+
+def print_test_result(test_num, description, query, response, error):
+    """Display the results of a single test"""
     print_test_header(test_num, description)
     print(f"\nQuery: {query}\n")
     print("-" * 80)
     
-    try:
-        response = run_agent(query)
+    if error is None:
         print(f"\nAgent Response:\n{response}\n")
         return True
-    except Exception as e:
-        print(f"\n❌ ERROR: {str(e)}\n")
-        return False
+    print(f"\n❌ ERROR: {str(error)}\n")
+    return False
 
-def main():
-    """Run all test cases"""
+async def main():
+    """Run all test cases concurrently"""
     print("\n" + "🤖 RETURNS & REFUNDS AGENT TEST SUITE".center(80))
     print("=" * 80)
     
-    tests_passed = 0
-    total_tests = 5
-    
-    # Test 1: Current time
-    if run_test(1, "Current Time Check", "What time is it?"):
-        tests_passed += 1
+    total_tests = len(TEST_CASES)
     
-    # Test 2: Return eligibility check
-    if run_test(2, "Return Eligibility Check", 
-                "Can I return a laptop I purchased 25 days ago?"):
-        tests_passed += 1
-    
-    # Test 3: Refund calculation
-    if run_test(3, "Refund Calculation", 
-                "Calculate my refund for a $500 item returned due to defect in like-new condition"):
-        tests_passed += 1
+    # The queries are independent, so run them at the same time and print
+    # the results in order once they have all finished
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+    results = await asyncio.gather(*[run_test(semaphore, query) for _, query in TEST_CASES])
     
-    # Test 4: Policy explanation
-    if run_test(4, "Policy Explanation", 
-                "Explain the return policy for electronics in a simple way"):
-        tests_passed += 1
-    
-    # Test 5: Knowledge base retrieval
-    if run_test(5, "Knowledge Base Retrieval", 
-                "Use the retrieve tool to search the knowledge base for 'Amazon return policy for electronics'"):
-        tests_passed += 1
+    tests_passed = 0
+    for test_num, ((description, query), (response, error)) in enumerate(zip(TEST_CASES, results), 1):
+        if print_test_result(test_num, description, query, response, error):
+            tests_passed += 1
     
     # Summary
     print("\n" + "="*80)
@@ -78,5 +93,5 @@ def main():
     return tests_passed == total_tests
 
 if __name__ == "__main__":
-    success = main()
+    success = asyncio.run(main())
     sys.exit(0 if success else 1)
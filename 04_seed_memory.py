@@ -3,8 +3,10 @@
 Script to seed AgentCore Memory with sample customer conversations.
 """
 
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config_loader import load_config
 
 try:
     from bedrock_agentcore.memory import MemoryClient
@@ -14,9 +16,8 @@ except ImportError:
     exit(1)
 
 # Load memory_id from config
-with open('memory_config.json') as f:
-    config = json.load(f)
-    memory_id = config['memory_id']
+config = load_config('memory_config.json')
+memory_id = config['memory_id']
 
 print(f"Using Memory ID: {memory_id}")
 print(f"Region: us-west-2")
@@ -27,7 +28,6 @@ print("="*80)
 memory_client = MemoryClient(region_name='us-west-2')
 
 # Conversation 1: Customer mentions email preference and previous defective laptop return
-print("\n📝 Storing Conversation 1: Email preference and defective laptop history")
 messages_1 = [
     ("Hello, I need help with a return. I prefer to receive notifications via email.", "USER"),
     ("I'd be happy to help you with your return! I've noted your preference for email notifications. Could you please tell me more about the item you'd like to return?", "ASSISTANT"),
@@ -35,20 +35,7 @@ messages_1 = [
     ("Yes, the return process is the same. For defective items like your laptop, you're eligible for a full refund including shipping costs. The return window for electronics is 30 days from purchase. Is this a new return you'd like to process?", "ASSISTANT")
 ]
 
-memory_client.create_event(
-    memory_id=memory_id,
-    actor_id="user_001",
-    session_id="session_001",
-    messages=messages_1
-)
-
-print(f"✓ Stored {len(messages_1)} messages from conversation 1")
-
-# Small delay between conversations
-time.sleep(2)
-
 # Conversation 2: Customer asks about return windows for electronics
-print("\n📝 Storing Conversation 2: Return windows for electronics inquiry")
 messages_2 = [
     ("Hi, I have a question about return policies. What's the return window for electronics?", "USER"),
     ("Great question! For most electronics, the return window is 30 days from the date of purchase. This includes items like laptops, tablets, smartphones, and other electronic devices. The item should be in its original condition with all accessories and packaging.", "ASSISTANT"),
@@ -58,27 +45,83 @@ messages_2 = [
     ("You're welcome! If you need to process a return, just let me know and I'll guide you through the process.", "ASSISTANT")
 ]
 
-memory_client.create_event(
-    memory_id=memory_id,
-    actor_id="user_001",
-    session_id="session_002",
-    messages=messages_2
-)
+# (session_id, description, messages) for each conversation
+conversations = [
+    ("session_001", "Email preference and defective laptop history", messages_1),
+    ("session_002", "Return windows for electronics inquiry", messages_2),
+]
+
+def store_conversation(session_id, messages):
+    """Store one conversation as a memory event"""
+    memory_client.create_event(
+        memory_id=memory_id,
+        actor_id="user_001",
+        session_id=session_id,
+        messages=messages
+    )
 
-print(f"✓ Stored {len(messages_2)} messages from conversation 2")
+# The conversations are independent sessions, so store them in parallel
+print("\n📝 Storing conversations:")
+for i, (session_id, description, _) in enumerate(conversations, 1):
+    print(f"   Conversation {i}: {description}")
+
+with ThreadPoolExecutor(max_workers=len(conversations)) as executor:
+    futures = [
+        executor.submit(store_conversation, session_id, messages)
+        for session_id, _, messages in conversations
+    ]
+    for i, (future, (_, _, messages)) in enumerate(zip(futures, conversations), 1):
+        future.result()
+        print(f"✓ Stored {len(messages)} messages from conversation {i}")
 
 # Wait for memory processing
 print("\n" + "="*80)
-print("⏳ Waiting 30 seconds for memory processing...")
+print("⏳ Waiting up to 30 seconds for memory processing...")
 print("   Memory strategies will extract:")
 print("   - Preferences: Email notification preference")
 print("   - Semantic: Previous defective laptop return, return window knowledge")
 print("   - Summary: Conversation context and summaries")
 print("="*80)
 
-for i in range(30, 0, -5):
-    print(f"   {i} seconds remaining...")
-    time.sleep(5)
+# Namespaces to check (with a query for each) before considering processing done
+EXPECTED_NAMESPACES = [
+    ("app/user_001/preferences", "customer preferences and communication"),
+    ("app/user_001/semantic", "previous returns and laptop"),
+    ("app/user_001/session_001/summary", "conversation summary"),
+    ("app/user_001/session_002/summary", "conversation summary"),
+]
+
+def namespace_ready(namespace, query):
+    """Return True once the namespace has at least one extracted memory"""
+    try:
+        return bool(memory_client.retrieve_memories(
+            memory_id=memory_id,
+            namespace=namespace,
+            query=query,
+            top_k=1
+        ))
+    except Exception:
+        return False
+
+# Poll every 2 seconds and stop early once every namespace has memories
+started = time.monotonic()
+deadline = started + 30
+pending = list(EXPECTED_NAMESPACES)
+while True:
+    with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+        ready = list(executor.map(lambda check: namespace_ready(*check), pending))
+    pending = [check for check, is_ready in zip(pending, ready) if not is_ready]
+    remaining = deadline - time.monotonic()
+    if not pending or remaining <= 0:
+        break
+    time.sleep(min(2, remaining))
+
+print(f"   Waited {time.monotonic() - started:.0f} seconds")
+
+if pending:
+    print("⚠️  Some namespaces are still processing (this can take a little longer):")
+    for namespace, _ in pending:
+        print(f"   - {namespace}")
 
 print("\n✓ Memory seeding complete!")
 print(f"✓ Total conversations stored: 2")
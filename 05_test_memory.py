@@ -2,21 +2,20 @@
 """
 Script to test memory retrieval for user_001.
 Retrieves memories from all namespaces to show what the agent remembers.
+
+Options:
+  --no-cache  Skip the local retrieval cache
 """
 
-import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
-try:
-    from bedrock_agentcore.memory import MemoryClient
-except ImportError:
-    print("✗ Error: bedrock_agentcore package not found")
-    print("  Install with: pip install bedrock-agentcore")
-    exit(1)
+from config_loader import load_config
+from memory_cache import CacheClient
 
 # Load memory_id from config
-with open('memory_config.json') as f:
-    config = json.load(f)
-    memory_id = config['memory_id']
+config = load_config('memory_config.json')
+memory_id = config['memory_id']
 
 print("="*80)
 print("AGENTCORE MEMORY RETRIEVAL TEST")
@@ -26,76 +25,114 @@ print(f"Region: us-west-2")
 print(f"Customer: user_001")
 print("="*80)
 
+# Import the SDK only once the config has loaded
+try:
+    from bedrock_agentcore.memory import MemoryClient
+except ImportError:
+    print("✗ Error: bedrock_agentcore package not found")
+    print("  Install with: pip install bedrock-agentcore")
+    exit(1)
+
 # Create memory client
 memory_client = MemoryClient(region_name='us-west-2')
 
-def retrieve_and_display(namespace, query, description):
-    """Retrieve and display memories from a specific namespace"""
-    print(f"\n📋 {description}")
-    print(f"   Namespace: {namespace}")
-    print(f"   Query: '{query}'")
-    print("-"*80)
+# Local cache of previous retrievals (skip with --no-cache)
+memory_cache = None if "--no-cache" in sys.argv else CacheClient()
+
+def fetch_memories(namespace, query):
+    """Retrieve memories from a specific namespace (no printing)"""
+    if memory_cache:
+        memories = memory_cache.get(memory_id, namespace, query)
+        if memories is not None:
+            return memories
+    
+    memories = memory_client.retrieve_memories(
+        memory_id=memory_id,
+        namespace=namespace,
+        query=query,
+        top_k=3
+    )
+    
+    # Only cache non-empty results; extraction may still be processing
+    if memory_cache and memories:
+        memory_cache.put(memory_id, namespace, query, memories)
+    return memories
+
+def format_memories(namespace, query, description, future):
+    """Format the result of a memory retrieval as a single block of text"""
+    lines = [
+        f"\n📋 {description}",
+        f"   Namespace: {namespace}",
+        f"   Query: '{query}'",
+        "-"*80
+    ]
     
     try:
-        memories = memory_client.retrieve_memories(
-            memory_id=memory_id,
-            namespace=namespace,
-            query=query,
-            top_k=3
-        )
+        memories = future.result()
         
         if memories:
-            print(f"✓ Found {len(memories)} memory/memories\n")
+            lines.append(f"✓ Found {len(memories)} memory/memories\n")
             
             for i, memory in enumerate(memories, 1):
-                print(f"Memory {i}:")
+                lines.append(f"Memory {i}:")
                 content = memory.get('content', {})
                 if isinstance(content, dict):
                     text = content.get('text', 'N/A')
                 else:
                     text = str(content)
-                print(f"  Content: {text}")
+                lines.append(f"  Content: {text}")
                 
                 relevance = memory.get('relevanceScore', 'N/A')
                 if isinstance(relevance, (int, float)):
-                    print(f"  Relevance Score: {relevance:.3f}")
+                    lines.append(f"  Relevance Score: {relevance:.3f}")
                 else:
-                    print(f"  Relevance Score: {relevance}")
-                print()
+                    lines.append(f"  Relevance Score: {relevance}")
+                lines.append("")
         else:
-            print("⚠️  No memories found in this namespace")
-            print("   (Memory extraction may still be processing)\n")
+            lines.append("⚠️  No memories found in this namespace")
+            lines.append("   (Memory extraction may still be processing)\n")
             
     except Exception as e:
-        print(f"❌ Error: {e}\n")
-
-# Test 1: Retrieve from preferences namespace
-retrieve_and_display(
-    namespace="app/user_001/preferences",
-    query="customer preferences and communication",
-    description="PREFERENCES - What does the customer prefer?"
-)
-
-# Test 2: Retrieve from semantic namespace
-retrieve_and_display(
-    namespace="app/user_001/semantic",
-    query="previous returns and laptop",
-    description="SEMANTIC - What facts do we know about this customer?"
-)
+        lines.append(f"❌ Error: {e}\n")
+    
+    return "\n".join(lines) + "\n"
 
-# Test 3: Retrieve from summary namespace (session 001)
-retrieve_and_display(
-    namespace="app/user_001/session_001/summary",
-    query="conversation summary",
-    description="SUMMARY (Session 1) - What was discussed?"
-)
+# (namespace, query, description) for each retrieval test
+tests = [
+    # Test 1: Retrieve from preferences namespace
+    (
+        "app/user_001/preferences",
+        "customer preferences and communication",
+        "PREFERENCES - What does the customer prefer?"
+    ),
+    # Test 2: Retrieve from semantic namespace
+    (
+        "app/user_001/semantic",
+        "previous returns and laptop",
+        "SEMANTIC - What facts do we know about this customer?"
+    ),
+    # Test 3: Retrieve from summary namespace (session 001)
+    (
+        "app/user_001/session_001/summary",
+        "conversation summary",
+        "SUMMARY (Session 1) - What was discussed?"
+    ),
+    # Test 4: Retrieve from summary namespace (session 002)
+    (
+        "app/user_001/session_002/summary",
+        "conversation summary",
+        "SUMMARY (Session 2) - What was discussed?"
+    ),
+]
 
-# Test 4: Retrieve from summary namespace (session 002)
-retrieve_and_display(
-    namespace="app/user_001/session_002/summary",
-    query="conversation summary",
-    description="SUMMARY (Session 2) - What was discussed?"
-)
+# Run all retrievals in parallel, then write results in test order in one go
+with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+    futures = [executor.submit(fetch_memories, namespace, query) for namespace, query, _ in tests]
+    output = "".join(
+        format_memories(namespace, query, description, future)
+        for (namespace, query, description), future in zip(tests, futures)
+    )
+sys.stdout.write(output)
 
 print("="*80)
 print("MEMORY TEST COMPLETE")
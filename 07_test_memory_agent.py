@@ -6,8 +6,11 @@ Tests if the agent recalls customer preferences and history.
 
 import os
 import sys
-import json
-import importlib.util
+import re
+import importlib
+
+from config_loader import load_config
+from memory_cache import AgentResponseCache
 
 # Load configuration files
 print("="*80)
@@ -16,20 +19,18 @@ print("="*80)
 
 # Load Memory ID from config
 try:
-    with open('memory_config.json') as f:
-        memory_config = json.load(f)
-        memory_id = memory_config.get('memory_id')
-        print(f"✓ Loaded Memory ID: {memory_id}")
+    memory_config = load_config('memory_config.json')
+    memory_id = memory_config.get('memory_id')
+    print(f"✓ Loaded Memory ID: {memory_id}")
 except FileNotFoundError:
     print("❌ Error: memory_config.json not found")
     sys.exit(1)
 
 # Load Knowledge Base ID from config
 try:
-    with open('kb_config.json') as f:
-        kb_config = json.load(f)
-        kb_id = kb_config.get('knowledge_base_id')
-        print(f"✓ Loaded Knowledge Base ID: {kb_id}")
+    kb_config = load_config('kb_config.json')
+    kb_id = kb_config.get('knowledge_base_id')
+    print(f"✓ Loaded Knowledge Base ID: {kb_id}")
 except FileNotFoundError:
     print("❌ Error: kb_config.json not found")
     sys.exit(1)
@@ -41,12 +42,31 @@ os.environ["KNOWLEDGE_BASE_ID"] = kb_id
 print("="*80)
 
 # Import run_agent from 06_memory_enabled_agent.py using importlib
-spec = importlib.util.spec_from_file_location("memory_enabled_agent", "06_memory_enabled_agent.py")
-agent_module = importlib.util.module_from_spec(spec)
-sys.modules["memory_enabled_agent"] = agent_module
-spec.loader.exec_module(agent_module)
+# (import_module goes through the normal import system, so the compiled
+# bytecode in __pycache__ is reused between runs)
+agent_module = importlib.import_module("06_memory_enabled_agent")
+
+# Optionally reuse agent responses between runs (opt in with --cached or
+# AGENT_CACHE=1); off by default so the test always exercises the live agent
+use_agent_cache = "--cached" in sys.argv or os.environ.get("AGENT_CACHE") == "1"
+agent_cache = AgentResponseCache() if use_agent_cache else None
 
-run_agent = agent_module.run_agent
+def run_agent(user_input, actor_id, session_id):
+    """Run the agent, reusing a cached response for identical invocations"""
+    if agent_cache:
+        response = agent_cache.get(actor_id, session_id, user_input)
+        if response is not None:
+            print("(cached response - rerun without --cached to invoke the agent)\n")
+            return response
+    
+    response = agent_module.run_agent(
+        user_input=user_input,
+        actor_id=actor_id,
+        session_id=session_id
+    )
+    if agent_cache:
+        agent_cache.put(actor_id, session_id, user_input, response)
+    return response
 
 print("\n" + "="*80)
 print("TEST: Memory Recall for user_001")
@@ -59,6 +79,17 @@ print("  - Previous defective laptop return")
 print("  - Knowledge about return policies")
 print("="*80)
 
+# Keywords that indicate each memory element was recalled
+MEMORY_CHECKS = {
+    "Email Preference": {"email", "notification"},
+    "Previous Return": {"laptop", "defective", "previous", "returned"},
+    "Personalization": {"remember", "recall", "preference", "history"}
+}
+KEYWORD_PATTERN = re.compile("|".join(
+    re.escape(word)
+    for word in sorted(set().union(*MEMORY_CHECKS.values()), key=len, reverse=True)
+))
+
 # Test query
 user_query = "Hi! I'm thinking about returning something. What do you remember about my preferences?"
 
@@ -82,12 +113,11 @@ try:
     print("MEMORY RECALL VERIFICATION")
     print("="*80)
     
-    response_lower = response.lower()
-    
+    # Scan the response once and see which check keywords appear
+    found_keywords = set(KEYWORD_PATTERN.findall(response.lower()))
     checks = {
-        "Email Preference": any(word in response_lower for word in ["email", "notification"]),
-        "Previous Return": any(word in response_lower for word in ["laptop", "defective", "previous", "returned"]),
-        "Personalization": any(word in response_lower for word in ["remember", "recall", "preference", "history"])
+        check_name: bool(keywords & found_keywords)
+        for check_name, keywords in MEMORY_CHECKS.items()
     }
     
     print("\nMemory Elements Detected:")
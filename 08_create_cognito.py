@@ -4,10 +4,11 @@ Script to create Cognito User Pool for AgentCore Gateway authentication.
 Sets up OAuth 2.0 client credentials flow for machine-to-machine authentication.
 """
 
-import boto3
-import json
-import time
+import os
 import secrets
+from concurrent.futures import ThreadPoolExecutor
+from aws_clients import get_client
+from config_loader import save_config
 
 # Configuration
 REGION = "us-west-2"
@@ -24,8 +25,11 @@ print(f"User Pool Name: {USER_POOL_NAME}")
 print(f"Domain Prefix: {DOMAIN_PREFIX}")
 print("="*80)
 
-# Initialize Cognito client
-cognito_client = boto3.client('cognito-idp', region_name=REGION)
+# The resources are created with direct API calls rather than a CloudFormation
+# stack: the calls finish in a few seconds, while a stack adds its own
+# provisioning/polling time.
+# Initialize Cognito client (shared, cached client from aws_clients)
+cognito_client = get_client('cognito-idp', REGION)
 
 try:
     # Step 1: Create User Pool
@@ -56,77 +60,84 @@ try:
     print(f"✓ User Pool created: {user_pool_id}")
     
     # Step 2: Create User Pool Domain
-    print(f"\n📝 Step 2: Creating User Pool Domain with prefix '{DOMAIN_PREFIX}'...")
-    try:
-        domain_response = cognito_client.create_user_pool_domain(
-            Domain=DOMAIN_PREFIX,
-            UserPoolId=user_pool_id
-        )
-        print(f"✓ Domain created: {DOMAIN_PREFIX}.auth.{REGION}.amazoncognito.com")
-    except cognito_client.exceptions.InvalidParameterException as e:
-        if "Domain already exists" in str(e):
-            print(f"⚠️  Domain prefix already exists, using: {DOMAIN_PREFIX}")
-        else:
+    # The domain is only needed for the token endpoint, so create it in the
+    # background while the resource server and app client are set up
+    def create_domain():
+        """Create the hosted domain, returning a status line to print"""
+        try:
+            cognito_client.create_user_pool_domain(
+                Domain=DOMAIN_PREFIX,
+                UserPoolId=user_pool_id
+            )
+            return f"✓ Domain created: {DOMAIN_PREFIX}.auth.{REGION}.amazoncognito.com"
+        except cognito_client.exceptions.InvalidParameterException as e:
+            if "Domain already exists" in str(e):
+                return f"⚠️  Domain prefix already exists, using: {DOMAIN_PREFIX}"
             raise
     
-    # Wait for domain to be ready
-    print("⏳ Waiting 5 seconds for domain propagation...")
-    time.sleep(5)
-    
-    # Step 3: Create Resource Server with OAuth scopes
-    print(f"\n📝 Step 3: Creating Resource Server with OAuth scopes...")
-    try:
-        resource_server_response = cognito_client.create_resource_server(
+    print(f"\n📝 Step 2: Creating User Pool Domain with prefix '{DOMAIN_PREFIX}' (in background)...")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        domain_future = executor.submit(create_domain)
+        
+        # Step 3: Create Resource Server with OAuth scopes
+        print(f"\n📝 Step 3: Creating Resource Server with OAuth scopes...")
+        try:
+            resource_server_response = cognito_client.create_resource_server(
+                UserPoolId=user_pool_id,
+                Identifier=RESOURCE_SERVER_IDENTIFIER,
+                Name=RESOURCE_SERVER_NAME,
+                Scopes=[
+                    {
+                        'ScopeName': 'read',
+                        'ScopeDescription': 'Read access to returns agent'
+                    },
+                    {
+                        'ScopeName': 'write',
+                        'ScopeDescription': 'Write access to returns agent'
+                    }
+                ]
+            )
+            print(f"✓ Resource Server created: {RESOURCE_SERVER_IDENTIFIER}")
+            print(f"  Scopes: read, write")
+        except cognito_client.exceptions.InvalidParameterException as e:
+            if "already exists" in str(e):
+                print(f"⚠️  Resource Server already exists: {RESOURCE_SERVER_IDENTIFIER}")
+            else:
+                raise
+        
+        # Step 4: Create App Client for machine-to-machine authentication
+        print(f"\n📝 Step 4: Creating App Client with client credentials flow...")
+        app_client_response = cognito_client.create_user_pool_client(
             UserPoolId=user_pool_id,
-            Identifier=RESOURCE_SERVER_IDENTIFIER,
-            Name=RESOURCE_SERVER_NAME,
-            Scopes=[
-                {
-                    'ScopeName': 'read',
-                    'ScopeDescription': 'Read access to returns agent'
-                },
-                {
-                    'ScopeName': 'write',
-                    'ScopeDescription': 'Write access to returns agent'
-                }
-            ]
+            ClientName="ReturnsAgentGatewayClient",
+            GenerateSecret=True,
+            ExplicitAuthFlows=[],
+            AllowedOAuthFlows=['client_credentials'],
+            AllowedOAuthScopes=[
+                f"{RESOURCE_SERVER_IDENTIFIER}/read",
+                f"{RESOURCE_SERVER_IDENTIFIER}/write"
+            ],
+            AllowedOAuthFlowsUserPoolClient=True,
+            SupportedIdentityProviders=[]
         )
-        print(f"✓ Resource Server created: {RESOURCE_SERVER_IDENTIFIER}")
-        print(f"  Scopes: read, write")
-    except cognito_client.exceptions.InvalidParameterException as e:
-        if "already exists" in str(e):
-            print(f"⚠️  Resource Server already exists: {RESOURCE_SERVER_IDENTIFIER}")
-        else:
-            raise
-    
-    # Step 4: Create App Client for machine-to-machine authentication
-    print(f"\n📝 Step 4: Creating App Client with client credentials flow...")
-    app_client_response = cognito_client.create_user_pool_client(
-        UserPoolId=user_pool_id,
-        ClientName="ReturnsAgentGatewayClient",
-        GenerateSecret=True,
-        ExplicitAuthFlows=[],
-        AllowedOAuthFlows=['client_credentials'],
-        AllowedOAuthScopes=[
-            f"{RESOURCE_SERVER_IDENTIFIER}/read",
-            f"{RESOURCE_SERVER_IDENTIFIER}/write"
-        ],
-        AllowedOAuthFlowsUserPoolClient=True,
-        SupportedIdentityProviders=[]
-    )
-    
-    client_id = app_client_response['UserPoolClient']['ClientId']
-    print(f"✓ App Client created: {client_id}")
-    
-    # Step 5: Get client secret
-    print(f"\n📝 Step 5: Retrieving client secret...")
-    client_details = cognito_client.describe_user_pool_client(
-        UserPoolId=user_pool_id,
-        ClientId=client_id
-    )
-    
-    client_secret = client_details['UserPoolClient']['ClientSecret']
-    print(f"✓ Client secret retrieved")
+        
+        client_id = app_client_response['UserPoolClient']['ClientId']
+        print(f"✓ App Client created: {client_id}")
+        
+        # Step 5: Get client secret
+        print(f"\n📝 Step 5: Retrieving client secret...")
+        # create_user_pool_client already returns the generated secret
+        client_secret = app_client_response['UserPoolClient'].get('ClientSecret')
+        if client_secret is None:
+            client_details = cognito_client.describe_user_pool_client(
+                UserPoolId=user_pool_id,
+                ClientId=client_id
+            )
+            client_secret = client_details['UserPoolClient']['ClientSecret']
+        print(f"✓ Client secret retrieved")
+        
+        # Wait for the domain created in step 2
+        print(domain_future.result())
     
     # Step 6: Build configuration URLs
     print(f"\n📝 Step 6: Building OAuth endpoints...")
@@ -157,8 +168,7 @@ try:
         ]
     }
     
-    with open('cognito_config.json', 'w') as f:
-        json.dump(config, f, indent=2)
+    save_config('cognito_config.json', config)
     
     print(f"✓ Configuration saved to cognito_config.json")
     
@@ -180,6 +190,8 @@ try:
     
 except Exception as e:
     print(f"\n❌ Error: {str(e)}")
-    import traceback
-    traceback.print_exc()
+    # Full traceback only on request (DEBUG=1); the message above is usually enough
+    if os.getenv('DEBUG'):
+        import traceback
+        traceback.print_exc()
     exit(1)
@@ -4,15 +4,61 @@ Script to create IAM role for AgentCore Gateway.
 The gateway needs permissions to invoke Lambda functions and access AWS services.
 """
 
-import boto3
 import json
 import time
+from string import Template
+from aws_clients import iam, sts, wait_for_role_permission
+from config_loader import save_config
 
 # Configuration
 REGION = "us-west-2"
 ROLE_NAME = "ReturnsAgentGatewayRole"
 POLICY_NAME = "ReturnsAgentGatewayPolicy"
 
+# Trust policy - allows AgentCore Gateway service to assume this role
+TRUST_POLICY_JSON = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {
+                "Service": "bedrock-agentcore.amazonaws.com"
+            },
+            "Action": "sts:AssumeRole"
+        }
+    ]
+})
+
+# Policy document - grants permissions to invoke Lambda functions
+# ($region and $account_id are filled in once the account ID is known)
+POLICY_DOCUMENT_TEMPLATE = Template(json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Sid": "InvokeLambdaFunctions",
+            "Effect": "Allow",
+            "Action": [
+                "lambda:InvokeFunction"
+            ],
+            "Resource": [
+                "arn:aws:lambda:$region:$account_id:function:*"
+            ]
+        },
+        {
+            "Sid": "CloudWatchLogs",
+            "Effect": "Allow",
+            "Action": [
+                "logs:CreateLogGroup",
+                "logs:CreateLogStream",
+                "logs:PutLogEvents"
+            ],
+            "Resource": [
+                "arn:aws:logs:$region:$account_id:log-group:/aws/bedrock-agentcore/gateways/*"
+            ]
+        }
+    ]
+}))
+
 print("="*80)
 print("IAM ROLE SETUP FOR AGENTCORE GATEWAY")
 print("="*80)
@@ -22,8 +68,8 @@ print(f"Policy Name: {POLICY_NAME}")
 print("="*80)
 
 # Initialize IAM and STS clients
-iam_client = boto3.client('iam')
-sts_client = boto3.client('sts')
+iam_client = iam()
+sts_client = sts()
 
 try:
     # Get AWS account ID
@@ -34,24 +80,10 @@ try:
     # Step 1: Create IAM Role with trust policy for AgentCore Gateway
     print(f"\n📝 Step 1: Creating IAM Role '{ROLE_NAME}'...")
     
-    # Trust policy - allows AgentCore Gateway service to assume this role
-    trust_policy = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Effect": "Allow",
-                "Principal": {
-                    "Service": "bedrock-agentcore.amazonaws.com"
-                },
-                "Action": "sts:AssumeRole"
-            }
-        ]
-    }
-    
     try:
         role_response = iam_client.create_role(
             RoleName=ROLE_NAME,
-            AssumeRolePolicyDocument=json.dumps(trust_policy),
+            AssumeRolePolicyDocument=TRUST_POLICY_JSON,
             Description="IAM role for AgentCore Gateway to invoke Lambda functions and access AWS services",
             MaxSessionDuration=3600
         )
@@ -66,39 +98,10 @@ try:
     # Step 2: Create IAM Policy with Lambda invoke permissions
     print(f"\n📝 Step 2: Creating IAM Policy '{POLICY_NAME}'...")
     
-    # Policy document - grants permissions to invoke Lambda functions
-    policy_document = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Sid": "InvokeLambdaFunctions",
-                "Effect": "Allow",
-                "Action": [
-                    "lambda:InvokeFunction"
-                ],
-                "Resource": [
-                    f"arn:aws:lambda:{REGION}:{account_id}:function:*"
-                ]
-            },
-            {
-                "Sid": "CloudWatchLogs",
-                "Effect": "Allow",
-                "Action": [
-                    "logs:CreateLogGroup",
-                    "logs:CreateLogStream",
-                    "logs:PutLogEvents"
-                ],
-                "Resource": [
-                    f"arn:aws:logs:{REGION}:{account_id}:log-group:/aws/bedrock-agentcore/gateways/*"
-                ]
-            }
-        ]
-    }
-    
     try:
         policy_response = iam_client.create_policy(
             PolicyName=POLICY_NAME,
-            PolicyDocument=json.dumps(policy_document),
+            PolicyDocument=POLICY_DOCUMENT_TEMPLATE.substitute(region=REGION, account_id=account_id),
             Description="Policy for AgentCore Gateway to invoke Lambda functions"
         )
         policy_arn = policy_response['Policy']['Arn']
@@ -120,8 +123,18 @@ try:
         print(f"⚠️  Policy already attached to role")
     
     # Wait for IAM propagation
-    print(f"\n⏳ Waiting 10 seconds for IAM propagation...")
-    time.sleep(10)
+    print(f"\n⏳ Waiting for IAM propagation...")
+    if wait_for_role_permission(
+        role_arn,
+        ["lambda:InvokeFunction"],
+        [f"arn:aws:lambda:{REGION}:{account_id}:function:*"]
+    ):
+        print(f"✓ Role permissions are active")
+    else:
+        # Not confirmed in time, or the probe isn't permitted: fall back to
+        # the fixed wait
+        print(f"⚠️  Propagation not confirmed, waiting 10 seconds...")
+        time.sleep(10)
     
     # Step 4: Save configuration
     print(f"\n📝 Step 4: Saving configuration to gateway_role_config.json...")
@@ -134,8 +147,7 @@ try:
         "account_id": account_id
     }
     
-    with open('gateway_role_config.json', 'w') as f:
-        json.dump(config, f, indent=2)
+    save_config('gateway_role_config.json', config)
     
     print(f"✓ Configuration saved to gateway_role_config.json")
     
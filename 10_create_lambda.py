@@ -4,11 +4,12 @@ Script to create Lambda function for order lookup.
 This Lambda will be used as a Gateway target for the returns agent.
 """
 
-import boto3
 import json
 import zipfile
 import io
-import time
+import os
+from aws_clients import get_client, iam, wait_ready
+from config_loader import load_config, save_config
 
 # Configuration
 REGION = "us-west-2"
@@ -23,14 +24,10 @@ print(f"Function Name: {FUNCTION_NAME}")
 print("="*80)
 
 # Initialize clients
-lambda_client = boto3.client('lambda', region_name=REGION)
-iam_client = boto3.client('iam')
-sts_client = boto3.client('sts')
+lambda_client = get_client('lambda', REGION)
+iam_client = iam()
 
 try:
-    # Get account ID
-    account_id = sts_client.get_caller_identity()['Account']
-    
     # Step 1: Create Lambda execution role
     print("\n📝 Step 1: Creating Lambda execution role...")
     
@@ -63,29 +60,29 @@ try:
         )
         print("✓ Basic execution policy attached")
         
-        # Wait for role propagation
-        print("⏳ Waiting 10 seconds for IAM propagation...")
-        time.sleep(10)
-        
     except iam_client.exceptions.EntityAlreadyExistsException:
         print(f"⚠️  Role already exists, retrieving ARN...")
         role_response = iam_client.get_role(RoleName=LAMBDA_ROLE_NAME)
         lambda_role_arn = role_response['Role']['Arn']
         print(f"✓ Role ARN: {lambda_role_arn}")
     
+    # The role ARN already carries the account ID (arn:aws:iam::<account>:role/...),
+    # so there is no need for a separate sts:GetCallerIdentity round-trip
+    account_id = lambda_role_arn.split(':')[4]
+    
     # Step 2: Create Lambda function code
     print(f"\n📝 Step 2: Creating Lambda function code...")
     
     lambda_code = '''
 import json
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
-# Mock order database
+# Mock order database (ages in days, so eligibility needs no date arithmetic)
 ORDERS = {
     "ORD-001": {
         "order_id": "ORD-001",
         "product_name": "Dell XPS 15 Laptop",
-        "purchase_date": (datetime.now() - timedelta(days=15)).strftime("%Y-%m-%d"),
+        "days_since_purchase": 15,
         "amount": 1299.99,
         "category": "electronics",
         "condition": "unopened",
@@ -94,7 +91,7 @@ ORDERS = {
     "ORD-002": {
         "order_id": "ORD-002",
         "product_name": "iPhone 13 Pro",
-        "purchase_date": (datetime.now() - timedelta(days=45)).strftime("%Y-%m-%d"),
+        "days_since_purchase": 45,
         "amount": 999.99,
         "category": "electronics",
         "condition": "opened",
@@ -103,7 +100,7 @@ ORDERS = {
     "ORD-003": {
         "order_id": "ORD-003",
         "product_name": "Samsung Galaxy Tab S8",
-        "purchase_date": (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d"),
+        "days_since_purchase": 5,
         "amount": 649.99,
         "category": "electronics",
         "condition": "defective",
@@ -113,8 +110,7 @@ ORDERS = {
 
 def calculate_return_eligibility(order):
     """Calculate if order is eligible for return"""
-    purchase_date = datetime.strptime(order["purchase_date"], "%Y-%m-%d")
-    days_since_purchase = (datetime.now() - purchase_date).days
+    days_since_purchase = order["days_since_purchase"]
     
     # 30-day return window for electronics
     if days_since_purchase > 30:
@@ -145,7 +141,7 @@ def lambda_handler(event, context):
     """
     try:
         # Extract order_id from event
-        order_id = event.get("order_id", "").upper()
+        order_id = event.get("order_id", "")
         
         if not order_id:
             return {
@@ -155,8 +151,11 @@ def lambda_handler(event, context):
                 })
             }
         
-        # Look up order
+        # Look up order (IDs are stored upper-case; only normalize on a miss)
         order = ORDERS.get(order_id)
+        if order is None:
+            order_id = order_id.upper()
+            order = ORDERS.get(order_id)
         
         if not order:
             return {
@@ -174,7 +173,7 @@ def lambda_handler(event, context):
         response_data = {
             "order_id": order["order_id"],
             "product_name": order["product_name"],
-            "purchase_date": order["purchase_date"],
+            "purchase_date": (date.today() - timedelta(days=order["days_since_purchase"])).isoformat(),
             "amount": order["amount"],
             "category": order["category"],
             "condition": order["condition"],
@@ -197,10 +196,14 @@ def lambda_handler(event, context):
 '''
     
     # Create deployment package
+    # The source is only a few KB, so the fastest deflate level is plenty
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
         zip_file.writestr('lambda_function.py', lambda_code)
-    zip_buffer.seek(0)
+    # Take the payload once and reuse it for both create and update; botocore's
+    # blob validation rejects a memoryview, so this is the only copy made
+    zip_bytes = zip_buffer.getvalue()
+    zip_buffer.close()
     
     print("✓ Lambda code packaged")
     
@@ -208,25 +211,32 @@ def lambda_handler(event, context):
     print(f"\n📝 Step 3: Creating Lambda function '{FUNCTION_NAME}'...")
     
     try:
-        function_response = lambda_client.create_function(
-            FunctionName=FUNCTION_NAME,
-            Runtime='python3.12',
-            Role=lambda_role_arn,
-            Handler='lambda_function.lambda_handler',
-            Code={'ZipFile': zip_buffer.read()},
-            Description='Order lookup function for returns agent',
-            Timeout=30,
-            MemorySize=128
+        # A new role can take a few seconds to become assumable by Lambda;
+        # retry while Lambda rejects it rather than sleeping a fixed time
+        function_response = wait_ready(
+            lambda: lambda_client.create_function(
+                FunctionName=FUNCTION_NAME,
+                Runtime='python3.12',
+                # Pure-Python handler, so it runs unchanged on Graviton
+                Architectures=['arm64'],
+                Role=lambda_role_arn,
+                Handler='lambda_function.lambda_handler',
+                Code={'ZipFile': zip_bytes},
+                Description='Order lookup function for returns agent',
+                Timeout=30,
+                MemorySize=128
+            ),
+            ['InvalidParameterValueException']
         )
         function_arn = function_response['FunctionArn']
         print(f"✓ Lambda function created: {function_arn}")
         
     except lambda_client.exceptions.ResourceConflictException:
         print(f"⚠️  Function already exists, updating code...")
-        zip_buffer.seek(0)
         lambda_client.update_function_code(
             FunctionName=FUNCTION_NAME,
-            ZipFile=zip_buffer.read()
+            ZipFile=zip_bytes,
+            Architectures=['arm64']
         )
         function_response = lambda_client.get_function(FunctionName=FUNCTION_NAME)
         function_arn = function_response['Configuration']['FunctionArn']
@@ -236,9 +246,8 @@ def lambda_handler(event, context):
     print(f"\n📝 Step 4: Adding gateway invoke permissions...")
     
     try:
-        with open('gateway_role_config.json', 'r') as f:
-            gateway_config = json.load(f)
-            gateway_role_arn = gateway_config['role_arn']
+        gateway_config = load_config('gateway_role_config.json')
+        gateway_role_arn = gateway_config['role_arn']
             
         # Add permission for gateway to invoke Lambda
         try:
@@ -286,12 +295,12 @@ def lambda_handler(event, context):
         "function_arn": function_arn,
         "lambda_role_arn": lambda_role_arn,
         "region": REGION,
+        "account_id": account_id,
         "tool_schema": tool_schema,
         "sample_orders": ["ORD-001", "ORD-002", "ORD-003"]
     }
     
-    with open('lambda_config.json', 'w') as f:
-        json.dump(config, f, indent=2)
+    save_config('lambda_config.json', config)
     
     print("✓ Configuration saved to lambda_config.json")
     
@@ -313,6 +322,8 @@ def lambda_handler(event, context):
     
 except Exception as e:
     print(f"\n❌ Error: {str(e)}")
-    import traceback
-    traceback.print_exc()
+    # Full traceback only on request (DEBUG=1); the message above is usually enough
+    if os.getenv('DEBUG'):
+        import traceback
+        traceback.print_exc()
     exit(1)
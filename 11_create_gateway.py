@@ -7,8 +7,8 @@ Prerequisites:
 - gateway_role_config.json (from IAM role setup)
 """
 
-import json
-import boto3
+from aws_clients import agentcore_control
+from config_loader import load_config, save_config
 
 print("="*80)
 print("AGENTCORE GATEWAY SETUP")
@@ -17,8 +17,7 @@ print("="*80)
 # Load configuration
 print("\n📝 Loading configuration files...")
 try:
-    with open('cognito_config.json') as f:
-        cognito_config = json.load(f)
+    cognito_config = load_config('cognito_config.json')
     print(f"✓ Loaded Cognito config")
     print(f"  Client ID: {cognito_config['client_id']}")
     print(f"  Discovery URL: {cognito_config['discovery_url']}")
@@ -28,8 +27,7 @@ except FileNotFoundError:
     exit(1)
 
 try:
-    with open('gateway_role_config.json') as f:
-        role_config = json.load(f)
+    role_config = load_config('gateway_role_config.json')
     print(f"✓ Loaded Gateway role config")
     print(f"  Role ARN: {role_config['role_arn']}")
 except FileNotFoundError:
@@ -39,7 +37,7 @@ except FileNotFoundError:
 
 # Initialize AgentCore control plane client
 print(f"\n📝 Initializing AgentCore client...")
-gateway_client = boto3.client("bedrock-agentcore-control", region_name='us-west-2')
+gateway_client = agentcore_control()
 print("✓ Client initialized")
 
 # Build auth configuration for Cognito JWT
@@ -90,8 +88,7 @@ config = {
     "token_endpoint": cognito_config["token_endpoint"]
 }
 
-with open('gateway_config.json', 'w') as f:
-    json.dump(config, f, indent=2)
+save_config('gateway_config.json', config)
 
 print(f"✓ Configuration saved to gateway_config.json")
 
@@ -7,8 +7,8 @@ Prerequisites:
 - lambda_config.json (from Lambda creation)
 """
 
-import json
-import boto3
+from aws_clients import agentcore_control
+from config_loader import load_config, save_config
 
 print("="*80)
 print("ADD LAMBDA TARGET TO GATEWAY")
@@ -17,18 +17,20 @@ print("="*80)
 # Load gateway configuration
 print("\n📝 Loading configuration files...")
 try:
-    with open('gateway_config.json') as f:
-        gateway_config = json.load(f)
+    gateway_config = load_config('gateway_config.json', required=('gateway_id',))
     print(f"✓ Loaded gateway config")
     print(f"  Gateway ID: {gateway_config['gateway_id']}")
 except FileNotFoundError:
     print("❌ Error: gateway_config.json not found")
     print("   Run 11_create_gateway.py first")
     exit(1)
+except ValueError as e:
+    print(f"❌ Error: {e}")
+    print("   Re-run 11_create_gateway.py")
+    exit(1)
 
 try:
-    with open('lambda_config.json') as f:
-        lambda_config = json.load(f)
+    lambda_config = load_config('lambda_config.json', required=('function_arn', 'tool_schema'))
     print(f"✓ Loaded Lambda config")
     print(f"  Function ARN: {lambda_config['function_arn']}")
     print(f"  Tool Schema: {len(lambda_config['tool_schema'])} tool(s)")
@@ -36,17 +38,23 @@ except FileNotFoundError:
     print("❌ Error: lambda_config.json not found")
     print("   Run 10_create_lambda.py first")
     exit(1)
+except ValueError as e:
+    print(f"❌ Error: {e}")
+    print("   Re-run 10_create_lambda.py")
+    exit(1)
 
 # Initialize AgentCore control plane client
 print(f"\n📝 Initializing AgentCore client...")
-gateway_client = boto3.client("bedrock-agentcore-control", region_name='us-west-2')
+gateway_client = agentcore_control()
 print("✓ Client initialized")
 
-# Extract Lambda details
+# Extract Lambda details (plain references into the loaded config; nothing is copied)
 lambda_arn = lambda_config["function_arn"]
 tool_schema = lambda_config["tool_schema"]
 
 # Build Lambda target configuration with MCP protocol
+# (inlinePayload is a list of tool definition structures in the API model, not
+# a JSON string, so the parsed schema is passed through as-is)
 lambda_target_config = {
     "mcp": {
         "lambda": {
@@ -92,24 +100,25 @@ gateway_config["target_id"] = target_id
 gateway_config["target_name"] = "OrderLookup"
 gateway_config["lambda_arn"] = lambda_arn
 
-with open('gateway_config.json', 'w') as f:
-    json.dump(gateway_config, f, indent=2)
+save_config('gateway_config.json', gateway_config)
 
 print(f"✓ Configuration updated")
 
-# Summary
-print("\n" + "="*80)
-print("✅ LAMBDA TARGET ADDED TO GATEWAY!")
-print("="*80)
-print(f"Gateway ID: {gateway_config['gateway_id']}")
-print(f"Target ID: {target_id}")
-print(f"Target Name: OrderLookup")
-print(f"Tool Available: lookup_order")
-print("\n📋 Sample Orders:")
-for order_id in lambda_config.get('sample_orders', []):
-    print(f"   - {order_id}")
-print("\n💡 Next Steps:")
-print("   1. Test the gateway with an OAuth token")
-print("   2. Connect your agent to the gateway")
-print("   3. Agent can now use lookup_order tool")
-print("="*80)
+# Summary (built up and written in one go)
+summary = [
+    "\n" + "="*80,
+    "✅ LAMBDA TARGET ADDED TO GATEWAY!",
+    "="*80,
+    f"Gateway ID: {gateway_config['gateway_id']}",
+    f"Target ID: {target_id}",
+    f"Target Name: OrderLookup",
+    f"Tool Available: lookup_order",
+    "\n📋 Sample Orders:",
+    *(f"   - {order_id}" for order_id in lambda_config.get('sample_orders', [])),
+    "\n💡 Next Steps:",
+    "   1. Test the gateway with an OAuth token",
+    "   2. Connect your agent to the gateway",
+    "   3. Agent can now use lookup_order tool",
+    "="*80,
+]
+print("\n".join(summary))
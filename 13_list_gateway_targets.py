@@ -6,8 +6,8 @@ Prerequisites:
 - gateway_config.json (from gateway creation)
 """
 
-import json
-import boto3
+from aws_clients import agentcore_control
+from config_loader import load_config
 
 print("="*80)
 print("LIST GATEWAY TARGETS")
@@ -16,8 +16,7 @@ print("="*80)
 # Load configuration
 print("\n📝 Loading gateway configuration...")
 try:
-    with open('gateway_config.json') as f:
-        gateway_config = json.load(f)
+    gateway_config = load_config('gateway_config.json')
     print(f"✓ Loaded gateway config")
     print(f"  Gateway ID: {gateway_config['gateway_id']}")
     print(f"  Gateway URL: {gateway_config['gateway_url']}")
@@ -28,27 +27,41 @@ except FileNotFoundError:
 
 # Initialize AgentCore control plane client
 print(f"\n📝 Initializing AgentCore client...")
-gateway_client = boto3.client("bedrock-agentcore-control", region_name='us-west-2')
+gateway_client = agentcore_control()
 print("✓ Client initialized")
 
+def get_lambda_config(target):
+    """Return the Lambda configuration of an MCP target, or None"""
+    try:
+        return target['targetConfiguration']['mcp']['lambda']
+    except (KeyError, TypeError):
+        return None
+
+def get_inline_tools(lambda_info):
+    """Return the inline tool schema list of a Lambda target, or None"""
+    try:
+        return lambda_info['toolSchema']['inlinePayload']
+    except (KeyError, TypeError):
+        return None
+
 # List targets
 print(f"\n📝 Listing targets for gateway '{gateway_config.get('name', 'Unknown')}'...")
+total_targets = 0
+total_tools = 0
 try:
-    response = gateway_client.list_gateway_targets(
-        gatewayIdentifier=gateway_config["gateway_id"]
-    )
-    
-    targets = response.get("items", [])
-    
-    print(f"\n✓ Found {len(targets)} target(s)")
+    paginator = gateway_client.get_paginator('list_gateway_targets')
+    pages = paginator.paginate(gatewayIdentifier=gateway_config["gateway_id"])
     
-    if targets:
-        print("\n" + "="*80)
-        print("GATEWAY TARGETS")
-        print("="*80)
-        
-        for i, target in enumerate(targets, 1):
-            print(f"\n{i}. {target.get('name', 'N/A')}")
+    for page in pages:
+        for target in page.get("items", []):
+            total_targets += 1
+            
+            if total_targets == 1:
+                print("\n" + "="*80)
+                print("GATEWAY TARGETS")
+                print("="*80)
+            
+            print(f"\n{total_targets}. {target.get('name', 'N/A')}")
             print(f"   {'─'*76}")
             print(f"   Target ID:    {target.get('targetId', 'N/A')}")
             print(f"   Status:       {target.get('status', 'unknown')}")
@@ -57,24 +70,22 @@ try:
             print(f"   Updated:      {target.get('updatedAt', 'N/A')}")
             
             # Show target type if available
-            if 'targetConfiguration' in target:
-                config = target['targetConfiguration']
-                if 'mcp' in config:
-                    mcp_config = config['mcp']
-                    if 'lambda' in mcp_config:
-                        lambda_info = mcp_config['lambda']
-                        print(f"   Type:         Lambda")
-                        print(f"   Lambda ARN:   {lambda_info.get('lambdaArn', 'N/A')}")
-                        
-                        # Show tools if available
-                        if 'toolSchema' in lambda_info:
-                            tool_schema = lambda_info['toolSchema']
-                            if 'inlinePayload' in tool_schema:
-                                tools = tool_schema['inlinePayload']
-                                print(f"   Tools:        {len(tools)} tool(s)")
-                                for tool in tools:
-                                    print(f"                 - {tool.get('name', 'N/A')}: {tool.get('description', 'N/A')[:60]}...")
-    else:
+            lambda_info = get_lambda_config(target)
+            if lambda_info is not None:
+                print(f"   Type:         Lambda")
+                print(f"   Lambda ARN:   {lambda_info.get('lambdaArn', 'N/A')}")
+                
+                # Show tools if available
+                tools = get_inline_tools(lambda_info)
+                if tools is not None:
+                    total_tools += len(tools)
+                    print(f"   Tools:        {len(tools)} tool(s)")
+                    for tool in tools:
+                        print(f"                 - {tool.get('name', 'N/A')}: {tool.get('description', 'N/A')[:60]}...")
+    
+    print(f"\n✓ Found {total_targets} target(s)")
+    
+    if not total_targets:
         print("\n⚠️  No targets found for this gateway")
         print("   Run 12_add_lambda_to_gateway.py to add a Lambda target")
     
@@ -87,6 +98,6 @@ except Exception as e:
 # Summary
 print("\n💡 Gateway Status:")
 print(f"   Gateway ID: {gateway_config['gateway_id']}")
-print(f"   Total Targets: {len(targets)}")
-print(f"   Active Tools: {sum(len(t.get('targetConfiguration', {}).get('mcp', {}).get('lambda', {}).get('toolSchema', {}).get('inlinePayload', [])) for t in targets)}")
+print(f"   Total Targets: {total_targets}")
+print(f"   Active Tools: {total_tools}")
 print("="*80)
@@ -5,9 +5,12 @@ Tests memory, gateway, and knowledge base integration.
 """
 
 import os
+import re
 import sys
-import json
-import importlib.util
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+from config_loader import load_config
 
 print("="*80)
 print("FULL-FEATURED AGENT TEST")
@@ -24,18 +27,41 @@ config_files = {
     'kb': 'kb_config.json'
 }
 
-missing_configs = []
-for config_name, config_file in config_files.items():
+# Keys each config must provide, checked when it is loaded
+required_keys = {
+    'memory': ('memory_id',),
+    'gateway': ('gateway_url',),
+    'cognito': ('client_id', 'client_secret', 'discovery_url'),
+    'kb': ('knowledge_base_id',)
+}
+
+def try_load_config(config_name):
+    """Load a config file, returning None if it doesn't exist or an error message if it's incomplete"""
     try:
-        with open(config_file) as f:
-            configs[config_name] = json.load(f)
-        print(f"✓ Loaded {config_file}")
+        return load_config(config_files[config_name], required=required_keys[config_name])
     except FileNotFoundError:
+        return None
+    except ValueError as e:
+        return str(e)
+
+# Read the files concurrently, then report in the usual order
+with ThreadPoolExecutor(max_workers=len(config_files)) as executor:
+    loaded = list(executor.map(try_load_config, config_files))
+
+missing_configs = []
+for (config_name, config_file), config in zip(config_files.items(), loaded):
+    if config is None:
         print(f"❌ Missing {config_file}")
         missing_configs.append(config_file)
+    elif isinstance(config, str):
+        print(f"❌ {config}")
+        missing_configs.append(config_file)
+    else:
+        configs[config_name] = config
+        print(f"✓ Loaded {config_file}")
 
 if missing_configs:
-    print(f"\n❌ Error: Missing configuration files: {', '.join(missing_configs)}")
+    print(f"\n❌ Error: Missing or incomplete configuration files: {', '.join(missing_configs)}")
     print("   Please run the setup scripts first:")
     print("   - 03_create_memory.py")
     print("   - 08_create_cognito.py")
@@ -46,12 +72,14 @@ print("\n✓ All configuration files loaded successfully")
 
 # Set up environment variables
 print("\n📝 Setting up environment variables...")
-os.environ["MEMORY_ID"] = configs['memory']['memory_id']
-os.environ["KNOWLEDGE_BASE_ID"] = configs['kb']['knowledge_base_id']
-os.environ["GATEWAY_URL"] = configs['gateway']['gateway_url']
-os.environ["COGNITO_CLIENT_ID"] = configs['cognito']['client_id']
-os.environ["COGNITO_CLIENT_SECRET"] = configs['cognito']['client_secret']
-os.environ["COGNITO_DISCOVERY_URL"] = configs['cognito']['discovery_url']
+os.environ.update({
+    "MEMORY_ID": configs['memory']['memory_id'],
+    "KNOWLEDGE_BASE_ID": configs['kb']['knowledge_base_id'],
+    "GATEWAY_URL": configs['gateway']['gateway_url'],
+    "COGNITO_CLIENT_ID": configs['cognito']['client_id'],
+    "COGNITO_CLIENT_SECRET": configs['cognito']['client_secret'],
+    "COGNITO_DISCOVERY_URL": configs['cognito']['discovery_url']
+})
 
 print(f"✓ MEMORY_ID: {configs['memory']['memory_id']}")
 print(f"✓ KNOWLEDGE_BASE_ID: {configs['kb']['knowledge_base_id']}")
@@ -60,10 +88,11 @@ print(f"✓ COGNITO_CLIENT_ID: {configs['cognito']['client_id']}")
 
 # Import the full-featured agent
 print("\n📝 Importing full-featured agent...")
-spec = importlib.util.spec_from_file_location("full_agent", "14_full_agent.py")
-agent_module = importlib.util.module_from_spec(spec)
+# (import_module goes through the normal import system, so the compiled
+# bytecode in __pycache__ is reused between runs and invalidated by the usual
+# source mtime check; a leading digit only rules out the import statement)
+agent_module = importlib.import_module("14_full_agent")
 sys.modules["full_agent"] = agent_module
-spec.loader.exec_module(agent_module)
 
 run_agent = agent_module.run_agent
 
@@ -82,6 +111,19 @@ print("  ✓ Check return eligibility (15 days old, should be eligible)")
 print("  ✓ Provide personalized response mentioning email preference")
 print("="*80)
 
+# Keywords that show each integration point was used, compiled to one
+# alternation per check (words can overlap between checks, e.g. prefer/preference)
+CHECK_KEYWORDS = {
+    "Memory - Email Preference": ["email", "notification", "prefer"],
+    "Gateway - Order Lookup": ["ord-001", "dell", "xps", "laptop", "1299"],
+    "Return Eligibility": ["eligible", "return", "15 days", "30 days"],
+    "Personalization": ["remember", "preference", "noted"]
+}
+CHECK_PATTERNS = {
+    name: re.compile("|".join(map(re.escape, words)), re.IGNORECASE)
+    for name, words in CHECK_KEYWORDS.items()
+}
+
 user_query = "Hi! Can you look up my order ORD-001 and tell me if I can return it? Remember, I prefer email updates."
 
 print(f"\n📝 User Query:\n{user_query}\n")
@@ -104,14 +146,8 @@ try:
     print("INTEGRATION VERIFICATION")
     print("="*80)
     
-    response_lower = response.lower()
-    
-    checks = {
-        "Memory - Email Preference": any(word in response_lower for word in ["email", "notification", "prefer"]),
-        "Gateway - Order Lookup": any(word in response_lower for word in ["ord-001", "dell", "xps", "laptop", "1299", "$1299"]),
-        "Return Eligibility": any(word in response_lower for word in ["eligible", "return", "15 days", "30 days"]),
-        "Personalization": any(word in response_lower for word in ["remember", "preference", "noted"])
-    }
+    # One case-insensitive search per check instead of lower() + a substring scan per word
+    checks = {name: bool(pattern.search(response)) for name, pattern in CHECK_PATTERNS.items()}
     
     print("\nIntegration Points Detected:")
     for check_name, detected in checks.items():
@@ -7,14 +7,31 @@ agents in AgentCore Runtime with Memory, Gateway, and Knowledge Base access.
 """
 
 import json
-import boto3
 import time
+from concurrent.futures import ThreadPoolExecutor
+from aws_clients import iam, sts, wait_for_role_permission
+from config_loader import save_config
 
 # Configuration
 REGION = "us-west-2"
 ROLE_NAME = "ReturnsAgentRuntimeExecutionRole"
 POLICY_NAME = "ReturnsAgentRuntimePolicy"
 
+# Trust policy for bedrock-agentcore.amazonaws.com; it has no per-account
+# values, so it is serialized once here
+TRUST_POLICY_JSON = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {
+                "Service": "bedrock-agentcore.amazonaws.com"
+            },
+            "Action": "sts:AssumeRole"
+        }
+    ]
+})
+
 print("="*80)
 print("IAM RUNTIME EXECUTION ROLE SETUP")
 print("="*80)
@@ -23,170 +40,167 @@ print(f"Role Name: {ROLE_NAME}")
 print(f"Policy Name: {POLICY_NAME}")
 print("="*80)
 
-# Create IAM client
-iam_client = boto3.client('iam', region_name=REGION)
-sts_client = boto3.client('sts', region_name=REGION)
+# Create IAM clients (shared, cached clients from aws_clients). Both come from
+# its single boto3 Session, so credentials are resolved once.
+iam_client = iam()
+sts_client = sts()
 
-try:
-    # Get AWS account ID
-    print("\n📝 Getting AWS Account ID...")
-    account_id = sts_client.get_caller_identity()['Account']
-    print(f"✓ Account ID: {account_id}")
-    
-    # Step 1: Define trust policy for bedrock-agentcore.amazonaws.com
-    print(f"\n📝 Step 1: Creating IAM role with trust policy...")
-    trust_policy = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Effect": "Allow",
-                "Principal": {
-                    "Service": "bedrock-agentcore.amazonaws.com"
-                },
-                "Action": "sts:AssumeRole"
-            }
-        ]
-    }
-    
+def create_role():
+    """Create the execution role (or fetch the existing one), returning its ARN and status lines"""
     try:
         role_response = iam_client.create_role(
             RoleName=ROLE_NAME,
-            AssumeRolePolicyDocument=json.dumps(trust_policy),
+            AssumeRolePolicyDocument=TRUST_POLICY_JSON,
             Description="Execution role for Returns Agent Runtime with Memory, Gateway, and KB access"
         )
         role_arn = role_response['Role']['Arn']
-        print(f"✓ Role created: {ROLE_NAME}")
-        print(f"✓ Role ARN: {role_arn}")
+        return role_arn, [f"✓ Role created: {ROLE_NAME}", f"✓ Role ARN: {role_arn}"]
     except iam_client.exceptions.EntityAlreadyExistsException:
-        print(f"⚠️  Role already exists, retrieving ARN...")
         role_response = iam_client.get_role(RoleName=ROLE_NAME)
         role_arn = role_response['Role']['Arn']
-        print(f"✓ Role ARN: {role_arn}")
-    
-    # Step 2: Create comprehensive permissions policy
-    print(f"\n📝 Step 2: Creating permissions policy...")
-    permissions_policy = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Sid": "BedrockModelAccess",
-                "Effect": "Allow",
-                "Action": [
-                    "bedrock:InvokeModel",
-                    "bedrock:InvokeModelWithResponseStream"
-                ],
-                "Resource": "*"
-            },
-            {
-                "Sid": "AgentCoreMemoryAccess",
-                "Effect": "Allow",
-                "Action": [
-                    "bedrock-agentcore:GetMemory",
-                    "bedrock-agentcore:CreateEvent",
-                    "bedrock-agentcore:GetLastKTurns",
-                    "bedrock-agentcore:RetrieveMemory",
-                    "bedrock-agentcore:ListEvents",
-                    "bedrock-agentcore:GetMemoryRecord",
-                    "bedrock-agentcore:RetrieveMemoryRecords",
-                    "bedrock-agentcore:ListMemoryRecords"
-                ],
-                "Resource": f"arn:aws:bedrock-agentcore:{REGION}:{account_id}:memory/*"
-            },
-            {
-                "Sid": "KnowledgeBaseAccess",
-                "Effect": "Allow",
-                "Action": [
-                    "bedrock-agent:Retrieve"
-                ],
-                "Resource": f"arn:aws:bedrock:{REGION}:{account_id}:knowledge-base/*"
-            },
-            {
-                "Sid": "CloudWatchLogsAccess",
-                "Effect": "Allow",
-                "Action": [
-                    "logs:CreateLogGroup",
-                    "logs:CreateLogStream",
-                    "logs:PutLogEvents",
-                    "logs:DescribeLogStreams",
-                    "logs:DescribeLogGroups"
-                ],
-                "Resource": [
-                    f"arn:aws:logs:{REGION}:{account_id}:log-group:/aws/bedrock-agentcore/*",
-                    f"arn:aws:logs:{REGION}:{account_id}:log-group:*"
-                ]
-            },
-            {
-                "Sid": "XRayAccess",
-                "Effect": "Allow",
-                "Action": [
-                    "xray:PutTraceSegments",
-                    "xray:PutTelemetryRecords",
-                    "xray:GetSamplingRules",
-                    "xray:GetSamplingTargets"
-                ],
-                "Resource": "*"
-            },
-            {
-                "Sid": "GatewayAccess",
-                "Effect": "Allow",
-                "Action": [
-                    "bedrock-agentcore:InvokeGateway",
-                    "bedrock-agentcore:GetGateway",
-                    "bedrock-agentcore:ListGatewayTargets"
-                ],
-                "Resource": f"arn:aws:bedrock-agentcore:{REGION}:{account_id}:gateway/*"
-            },
-            {
-                "Sid": "ECRAccess",
-                "Effect": "Allow",
-                "Action": [
-                    "ecr:GetAuthorizationToken",
-                    "ecr:BatchCheckLayerAvailability",
-                    "ecr:GetDownloadUrlForLayer",
-                    "ecr:BatchGetImage"
-                ],
-                "Resource": "*"
-            },
-            {
-                "Sid": "CloudWatchMetrics",
-                "Effect": "Allow",
-                "Action": "cloudwatch:PutMetricData",
-                "Resource": "*",
-                "Condition": {
-                    "StringEquals": {
-                        "cloudwatch:namespace": "bedrock-agentcore"
+        return role_arn, ["⚠️  Role already exists, retrieved ARN", f"✓ Role ARN: {role_arn}"]
+
+try:
+    # Step 1: Create the role in the background; it doesn't depend on the
+    # account ID or the policy, which are handled meanwhile
+    print(f"\n📝 Step 1: Creating IAM role with trust policy (in background)...")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        role_future = executor.submit(create_role)
+        
+        # Get AWS account ID
+        print("\n📝 Getting AWS Account ID...")
+        account_id = sts_client.get_caller_identity()['Account']
+        print(f"✓ Account ID: {account_id}")
+        
+        # Step 2: Create comprehensive permissions policy
+        print(f"\n📝 Step 2: Creating permissions policy...")
+        permissions_policy = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Sid": "BedrockModelAccess",
+                    "Effect": "Allow",
+                    "Action": [
+                        "bedrock:InvokeModel",
+                        "bedrock:InvokeModelWithResponseStream"
+                    ],
+                    "Resource": "*"
+                },
+                {
+                    "Sid": "AgentCoreMemoryAccess",
+                    "Effect": "Allow",
+                    "Action": [
+                        "bedrock-agentcore:GetMemory",
+                        "bedrock-agentcore:CreateEvent",
+                        "bedrock-agentcore:GetLastKTurns",
+                        "bedrock-agentcore:RetrieveMemory",
+                        "bedrock-agentcore:ListEvents",
+                        "bedrock-agentcore:GetMemoryRecord",
+                        "bedrock-agentcore:RetrieveMemoryRecords",
+                        "bedrock-agentcore:ListMemoryRecords"
+                    ],
+                    "Resource": f"arn:aws:bedrock-agentcore:{REGION}:{account_id}:memory/*"
+                },
+                {
+                    "Sid": "KnowledgeBaseAccess",
+                    "Effect": "Allow",
+                    "Action": [
+                        "bedrock-agent:Retrieve"
+                    ],
+                    "Resource": f"arn:aws:bedrock:{REGION}:{account_id}:knowledge-base/*"
+                },
+                {
+                    "Sid": "CloudWatchLogsAccess",
+                    "Effect": "Allow",
+                    "Action": [
+                        "logs:CreateLogGroup",
+                        "logs:CreateLogStream",
+                        "logs:PutLogEvents",
+                        "logs:DescribeLogStreams",
+                        "logs:DescribeLogGroups"
+                    ],
+                    "Resource": [
+                        f"arn:aws:logs:{REGION}:{account_id}:log-group:/aws/bedrock-agentcore/*",
+                        f"arn:aws:logs:{REGION}:{account_id}:log-group:*"
+                    ]
+                },
+                {
+                    "Sid": "XRayAccess",
+                    "Effect": "Allow",
+                    "Action": [
+                        "xray:PutTraceSegments",
+                        "xray:PutTelemetryRecords",
+                        "xray:GetSamplingRules",
+                        "xray:GetSamplingTargets"
+                    ],
+                    "Resource": "*"
+                },
+                {
+                    "Sid": "GatewayAccess",
+                    "Effect": "Allow",
+                    "Action": [
+                        "bedrock-agentcore:InvokeGateway",
+                        "bedrock-agentcore:GetGateway",
+                        "bedrock-agentcore:ListGatewayTargets"
+                    ],
+                    "Resource": f"arn:aws:bedrock-agentcore:{REGION}:{account_id}:gateway/*"
+                },
+                {
+                    "Sid": "ECRAccess",
+                    "Effect": "Allow",
+                    "Action": [
+                        "ecr:GetAuthorizationToken",
+                        "ecr:BatchCheckLayerAvailability",
+                        "ecr:GetDownloadUrlForLayer",
+                        "ecr:BatchGetImage"
+                    ],
+                    "Resource": "*"
+                },
+                {
+                    "Sid": "CloudWatchMetrics",
+                    "Effect": "Allow",
+                    "Action": "cloudwatch:PutMetricData",
+                    "Resource": "*",
+                    "Condition": {
+                        "StringEquals": {
+                            "cloudwatch:namespace": "bedrock-agentcore"
+                        }
                     }
+                },
+                {
+                    "Sid": "WorkloadIdentityAccess",
+                    "Effect": "Allow",
+                    "Action": [
+                        "bedrock-agentcore:GetWorkloadAccessToken",
+                        "bedrock-agentcore:GetWorkloadAccessTokenForJWT",
+                        "bedrock-agentcore:GetWorkloadAccessTokenForUserId"
+                    ],
+                    "Resource": [
+                        f"arn:aws:bedrock-agentcore:{REGION}:{account_id}:workload-identity-directory/default",
+                        f"arn:aws:bedrock-agentcore:{REGION}:{account_id}:workload-identity-directory/default/workload-identity/*"
+                    ]
                 }
-            },
-            {
-                "Sid": "WorkloadIdentityAccess",
-                "Effect": "Allow",
-                "Action": [
-                    "bedrock-agentcore:GetWorkloadAccessToken",
-                    "bedrock-agentcore:GetWorkloadAccessTokenForJWT",
-                    "bedrock-agentcore:GetWorkloadAccessTokenForUserId"
-                ],
-                "Resource": [
-                    f"arn:aws:bedrock-agentcore:{REGION}:{account_id}:workload-identity-directory/default",
-                    f"arn:aws:bedrock-agentcore:{REGION}:{account_id}:workload-identity-directory/default/workload-identity/*"
-                ]
-            }
-        ]
-    }
-    
-    try:
-        policy_response = iam_client.create_policy(
-            PolicyName=POLICY_NAME,
-            PolicyDocument=json.dumps(permissions_policy),
-            Description="Permissions for Returns Agent Runtime with Memory, Gateway, and KB"
-        )
-        policy_arn = policy_response['Policy']['Arn']
-        print(f"✓ Policy created: {POLICY_NAME}")
-        print(f"✓ Policy ARN: {policy_arn}")
-    except iam_client.exceptions.EntityAlreadyExistsException:
-        print(f"⚠️  Policy already exists, retrieving ARN...")
-        policy_arn = f"arn:aws:iam::{account_id}:policy/{POLICY_NAME}"
-        print(f"✓ Policy ARN: {policy_arn}")
+            ]
+        }
+        
+        try:
+            policy_response = iam_client.create_policy(
+                PolicyName=POLICY_NAME,
+                PolicyDocument=json.dumps(permissions_policy),
+                Description="Permissions for Returns Agent Runtime with Memory, Gateway, and KB"
+            )
+            policy_arn = policy_response['Policy']['Arn']
+            print(f"✓ Policy created: {POLICY_NAME}")
+            print(f"✓ Policy ARN: {policy_arn}")
+        except iam_client.exceptions.EntityAlreadyExistsException:
+            print(f"⚠️  Policy already exists, retrieving ARN...")
+            policy_arn = f"arn:aws:iam::{account_id}:policy/{POLICY_NAME}"
+            print(f"✓ Policy ARN: {policy_arn}")
+        
+        # Wait for the role created in step 1
+        role_arn, role_status = role_future.result()
+    for line in role_status:
+        print(line)
     
     # Step 3: Attach policy to role
     print(f"\n📝 Step 3: Attaching policy to role...")
@@ -201,8 +215,19 @@ try:
     
     # Step 4: Wait for role to propagate
     print(f"\n📝 Step 4: Waiting for IAM propagation...")
-    time.sleep(10)
-    print(f"✓ IAM propagation complete")
+    # Poll until IAM reports the attached policy as effective instead of
+    # always sleeping for the worst case
+    if wait_for_role_permission(
+        role_arn,
+        ["bedrock:InvokeModel"],
+        ["*"]
+    ):
+        print(f"✓ IAM propagation complete")
+    else:
+        # Not confirmed in time, or the probe isn't permitted: fall back to
+        # the fixed wait
+        print(f"⚠️  Propagation not confirmed, waiting 10 seconds...")
+        time.sleep(10)
     
     # Save configuration
     print(f"\n📝 Step 5: Saving configuration...")
@@ -215,32 +240,34 @@ try:
         "account_id": account_id
     }
     
-    with open('runtime_execution_role_config.json', 'w') as f:
-        json.dump(config, f, indent=2)
+    save_config('runtime_execution_role_config.json', config)
     
     print(f"✓ Configuration saved to runtime_execution_role_config.json")
     
-    # Summary
-    print("\n" + "="*80)
-    print("✅ RUNTIME EXECUTION ROLE SETUP COMPLETE!")
-    print("="*80)
-    print(f"Role ARN: {role_arn}")
-    print(f"Policy ARN: {policy_arn}")
-    print("\n📋 Permissions Granted:")
-    print("   ✓ Bedrock - Invoke models (InvokeModel, InvokeModelWithResponseStream)")
-    print("   ✓ Memory - Full access (GetMemory, CreateEvent, RetrieveMemory, etc.)")
-    print("   ✓ Knowledge Base - Retrieve documents (bedrock-agent:Retrieve)")
-    print("   ✓ Gateway - Invoke and list (InvokeGateway, GetGateway, ListGatewayTargets)")
-    print("   ✓ CloudWatch Logs - Write and read logs")
-    print("   ✓ X-Ray - Distributed tracing")
-    print("   ✓ ECR - Pull container images")
-    print("   ✓ CloudWatch Metrics - Performance monitoring")
-    print("   ✓ Workload Identity - Secure credential management")
-    print("\n💡 Next Steps:")
-    print("   1. Use this role ARN for AgentCore Runtime deployment")
-    print("   2. Configure runtime with memory, gateway, and KB IDs")
-    print("   3. Deploy agent to runtime")
-    print("="*80)
+    # Summary (built up and written in one go)
+    summary = [
+        "\n" + "="*80,
+        "✅ RUNTIME EXECUTION ROLE SETUP COMPLETE!",
+        "="*80,
+        f"Role ARN: {role_arn}",
+        f"Policy ARN: {policy_arn}",
+        "\n📋 Permissions Granted:",
+        "   ✓ Bedrock - Invoke models (InvokeModel, InvokeModelWithResponseStream)",
+        "   ✓ Memory - Full access (GetMemory, CreateEvent, RetrieveMemory, etc.)",
+        "   ✓ Knowledge Base - Retrieve documents (bedrock-agent:Retrieve)",
+        "   ✓ Gateway - Invoke and list (InvokeGateway, GetGateway, ListGatewayTargets)",
+        "   ✓ CloudWatch Logs - Write and read logs",
+        "   ✓ X-Ray - Distributed tracing",
+        "   ✓ ECR - Pull container images",
+        "   ✓ CloudWatch Metrics - Performance monitoring",
+        "   ✓ Workload Identity - Secure credential management",
+        "\n💡 Next Steps:",
+        "   1. Use this role ARN for AgentCore Runtime deployment",
+        "   2. Configure runtime with memory, gateway, and KB IDs",
+        "   3. Deploy agent to runtime",
+        "="*80,
+    ]
+    print("\n".join(summary))
     
 except Exception as e:
     print(f"\n❌ Error: {str(e)}")
@@ -2,26 +2,24 @@
 """
 Deploy agent to AgentCore Runtime with all configurations
 """
-import json
-from bedrock_agentcore_starter_toolkit import Runtime
+from config_loader import load_configs, save_config
 
 # Load all configuration files
-with open('memory_config.json', 'r') as f:
-    memory_config = json.load(f)
-
-with open('gateway_config.json', 'r') as f:
-    gateway_config = json.load(f)
-
-with open('cognito_config.json', 'r') as f:
-    cognito_config = json.load(f)
-
-with open('runtime_execution_role_config.json', 'r') as f:
-    runtime_role_config = json.load(f)
-
-with open('kb_config.json', 'r') as f:
-    kb_config = json.load(f)
-
-# Initialize Runtime
+configs = load_configs([
+    'memory_config.json',
+    'gateway_config.json',
+    'cognito_config.json',
+    'runtime_execution_role_config.json',
+    'kb_config.json'
+])
+memory_config = configs['memory_config.json']
+gateway_config = configs['gateway_config.json']
+cognito_config = configs['cognito_config.json']
+runtime_role_config = configs['runtime_execution_role_config.json']
+kb_config = configs['kb_config.json']
+
+# Initialize Runtime (imported here so config errors fail fast)
+from bedrock_agentcore_starter_toolkit import Runtime
 runtime = Runtime()
 
 print("Configuring runtime deployment...")
@@ -75,8 +73,7 @@ runtime_config = {
     'region': 'us-west-2'
 }
 
-with open('runtime_config.json', 'w') as f:
-    json.dump(runtime_config, f, indent=2)
+save_config('runtime_config.json', runtime_config)
 
 print(f"\nConfiguration saved to runtime_config.json")
 print("\nUse 20_check_runtime_status.py to monitor deployment progress")
@@ -3,9 +3,9 @@
 Script to check AgentCore Runtime deployment status.
 """
 
-import json
 import os
-from bedrock_agentcore_starter_toolkit import Runtime
+from pathlib import Path
+from config_loader import dumps, load_configs
 
 # Check if runtime config exists
 if not os.path.exists('runtime_config.json'):
@@ -14,10 +14,9 @@ if not os.path.exists('runtime_config.json'):
     exit(1)
 
 # Load configuration files
-with open('runtime_execution_role_config.json') as f:
-    role_config = json.load(f)
-with open('cognito_config.json') as f:
-    cognito_config = json.load(f)
+configs = load_configs(['runtime_execution_role_config.json', 'cognito_config.json'])
+role_config = configs['runtime_execution_role_config.json']
+cognito_config = configs['cognito_config.json']
 
 # Load .bedrock_agentcore.yaml to get agent name and entrypoint
 if not os.path.exists('.bedrock_agentcore.yaml'):
@@ -34,38 +33,44 @@ agent_config = runtime_config.get('agents', {}).get(default_agent, {})
 agent_name = agent_config.get('name')
 entrypoint = agent_config.get('entrypoint')
 
-# Initialize Runtime
-runtime = Runtime()
-
-# Build authorizer configuration for Cognito JWT
-auth_config = {
-    "customJWTAuthorizer": {
-        "allowedClients": [cognito_config["client_id"]],
-        "discoveryUrl": cognito_config["discovery_url"]
-    }
-}
-
-# Configure runtime (to load existing configuration)
-print("Loading runtime configuration...")
-runtime.configure(
-    entrypoint=entrypoint,
-    agent_name=agent_name,
-    execution_role=role_config["role_arn"],
-    auto_create_ecr=True,
-    memory_mode="NO_MEMORY",
-    requirements_file="requirements.txt",
-    region="us-west-2",
-    authorizer_configuration=auth_config
-)
-
 # Check status
+# .bedrock_agentcore.yaml already exists (checked above), so read the status
+# straight from it. Runtime.configure() would rewrite the file and validate
+# the role/authorizer against the control plane on every status poll.
 print("Checking runtime deployment status...")
-status_response = runtime.status()
+try:
+    from bedrock_agentcore_starter_toolkit.operations.runtime import get_status
+    status_response = get_status(Path('.bedrock_agentcore.yaml'), agent_name=agent_name)
+except (ImportError, FileNotFoundError):
+    # Fall back to configuring the runtime before asking for its status
+    from bedrock_agentcore_starter_toolkit import Runtime
+    runtime = Runtime()
+    
+    # Build authorizer configuration for Cognito JWT
+    auth_config = {
+        "customJWTAuthorizer": {
+            "allowedClients": [cognito_config["client_id"]],
+            "discoveryUrl": cognito_config["discovery_url"]
+        }
+    }
+    
+    print("Loading runtime configuration...")
+    runtime.configure(
+        entrypoint=entrypoint,
+        agent_name=agent_name,
+        execution_role=role_config["role_arn"],
+        auto_create_ecr=True,
+        memory_mode="NO_MEMORY",
+        requirements_file="requirements.txt",
+        region="us-west-2",
+        authorizer_configuration=auth_config
+    )
+    status_response = runtime.status()
 
 status = status_response.endpoint["status"]
 
 print(f"\nAgent Status: {status}")
-print(f"Endpoint Details: {json.dumps(status_response.endpoint, indent=2, default=str)}")
+print(f"Endpoint Details: {dumps(status_response.endpoint, indent=True)}")
 
 if status == "READY":
     print("\n" + "=" * 80)
@@ -2,19 +2,24 @@
 """
 Invoke the deployed AgentCore Runtime agent with authentication
 """
-import json
+import os
+import time
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 import base64
-from bedrock_agentcore_starter_toolkit import Runtime
+from config_loader import dumps, load_config, load_configs
 
-# Load configuration files
-with open('cognito_config.json', 'r') as f:
-    cognito_config = json.load(f)
+# Shared HTTP session so connections to the Cognito endpoint are reused
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
-with open('runtime_execution_role_config.json', 'r') as f:
-    runtime_role_config = json.load(f)
+# Load configuration files
+configs = load_configs(['cognito_config.json', 'runtime_execution_role_config.json'])
+cognito_config = configs['cognito_config.json']
+runtime_role_config = configs['runtime_execution_role_config.json']
 
-# Step 1: Get OAuth token from Cognito
+# Step 1: Get OAuth token from Cognito (reusing a cached token if still valid)
 print("Getting OAuth token from Cognito...")
 
 # Prepare client credentials for Basic Auth
@@ -30,26 +35,56 @@ headers = {
     'Content-Type': 'application/x-www-form-urlencoded'
 }
 
-# Request all scopes
-scopes = ' '.join(cognito_config['scopes'])
+# Request all scopes (sorted so the token cache key doesn't depend on config order)
+scopes = ' '.join(sorted(cognito_config['scopes']))
 data = {
     'grant_type': 'client_credentials',
     'scope': scopes
 }
 
-response = requests.post(token_endpoint, headers=headers, data=data)
+# Tokens are cached per client/endpoint/scopes and reused until 60s before expiry
+TOKEN_CACHE_PATH = os.path.expanduser('~/.cache/agentcore/token.json')
+TOKEN_EXPIRY_MARGIN = 60
+cache_key = hashlib.sha256(f"{client_id}|{token_endpoint}|{scopes}".encode()).hexdigest()
 
-if response.status_code != 200:
-    print(f"❌ Failed to get OAuth token: {response.status_code}")
-    print(f"Response: {response.text}")
-    exit(1)
+# A missing, truncated or hand-edited cache file is treated as a miss
+bearer_token = None
+try:
+    token_cache = load_config(TOKEN_CACHE_PATH)
+    cached_token = token_cache.get(cache_key)
+    if cached_token and time.time() < cached_token['expires_at']:
+        bearer_token = cached_token['access_token']
+except (FileNotFoundError, ValueError, KeyError, TypeError, AttributeError):
+    token_cache = {}
 
-token_data = response.json()
-bearer_token = token_data['access_token']
-print(f"✅ OAuth token obtained successfully")
+if bearer_token:
+    print(f"✅ Reusing cached OAuth token")
+else:
+    response = http_session.post(token_endpoint, headers=headers, data=data)
+
+    if response.status_code != 200:
+        print(f"❌ Failed to get OAuth token: {response.status_code}")
+        print(f"Response: {response.text}")
+        exit(1)
+
+    token_data = response.json()
+    bearer_token = token_data['access_token']
+    print(f"✅ OAuth token obtained successfully")
+
+    # Save token to cache (owner read/write only)
+    token_cache[cache_key] = {
+        'access_token': bearer_token,
+        'scope': scopes,
+        'expires_at': time.time() + token_data.get('expires_in', 3600) - TOKEN_EXPIRY_MARGIN
+    }
+    os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), exist_ok=True)
+    fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        f.write(dumps(token_cache))
 
 # Step 2: Initialize Runtime and configure
 print("\nConfiguring runtime...")
+from bedrock_agentcore_starter_toolkit import Runtime
 runtime = Runtime()
 
 # Build authorizer configuration
@@ -99,7 +134,7 @@ try:
         elif 'output' in result:
             print(result['output'])
         else:
-            print(json.dumps(result, indent=2, default=str))
+            print(dumps(result, indent=True))
     elif hasattr(result, 'response'):
         print(result.response)
     else:
@@ -109,7 +144,7 @@ try:
     
     # Display full result for debugging
     print(f"\nFull Response Structure:")
-    print(json.dumps(result, indent=2, default=str) if isinstance(result, dict) else str(result))
+    print(dumps(result, indent=True) if isinstance(result, dict) else str(result))
     
     print(f"\n✅ Invocation completed successfully")
     
@@ -2,40 +2,60 @@
 AgentCore MCP Server - Tool Handlers
 
 This package contains all MCP tool handler implementations organized by feature domain.
+
+Each handler is a coroutine that takes the tool arguments and returns a dict
+describing the generated script (code, filename, instructions, ...). Handlers
+are exported lazily: __getattr__ imports a handler's submodule on first access.
 """
 
-from .identity_handlers import (
-    handle_create_runtime_execution_role_script,
-)
-from .memory_handlers import (
-    handle_memory_create,
-    handle_memory_create_event,
-    handle_memory_retrieve,
-    handle_memory_delete,
-)
-from .gateway_handlers import (
-    handle_gateway_create,
-    handle_gateway_add_lambda_target,
-    handle_gateway_list_targets,
-    handle_gateway_delete_target,
-    handle_gateway_delete,
-)
-from .runtime_handlers import (
-    handle_runtime_configure,
-    handle_runtime_launch,
-    handle_runtime_status,
-    handle_runtime_invoke,
-    handle_runtime_delete,
-)
-from .observability_handlers import (
-    handle_observability_get_dashboard_url,
-    handle_observability_get_logs_info,
-    handle_observability_get_recent_logs,
-)
-from .strands_handlers import (
-    handle_generate_strands_agent,
-    handle_generate_agentcore_runtime_agent,
-)
+import importlib
+
+# Handler name -> submodule that defines it. Submodules are imported on first
+# access (PEP 562) so the server only pays for the tools it actually uses.
+_HANDLER_MODULES = {
+    # Identity handlers
+    "handle_create_runtime_execution_role_script": "identity_handlers",
+    # Memory handlers
+    "handle_memory_create": "memory_handlers",
+    "handle_memory_create_event": "memory_handlers",
+    "handle_memory_retrieve": "memory_handlers",
+    "handle_memory_delete": "memory_handlers",
+    "handle_memory_pipeline": "memory_handlers",
+    # Gateway handlers
+    "handle_gateway_create": "gateway_handlers",
+    "handle_gateway_add_lambda_target": "gateway_handlers",
+    "handle_gateway_list_targets": "gateway_handlers",
+    "handle_gateway_delete_target": "gateway_handlers",
+    "handle_gateway_delete": "gateway_handlers",
+    # Runtime handlers
+    "handle_runtime_configure": "runtime_handlers",
+    "handle_runtime_launch": "runtime_handlers",
+    "handle_runtime_status": "runtime_handlers",
+    "handle_runtime_invoke": "runtime_handlers",
+    "handle_runtime_delete": "runtime_handlers",
+    # Observability handlers
+    "handle_observability_get_dashboard_url": "observability_handlers",
+    "handle_observability_get_logs_info": "observability_handlers",
+    "handle_observability_get_recent_logs": "observability_handlers",
+    # Strands handlers
+    "handle_generate_strands_agent": "strands_handlers",
+    "handle_generate_agentcore_runtime_agent": "strands_handlers",
+}
+
+
+def __getattr__(name):
+    """Import the submodule defining a handler on first access and cache it"""
+    submodule = _HANDLER_MODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    handler = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = handler
+    return handler
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_HANDLER_MODULES))
+
 
 __all__ = [
     # Identity handlers
@@ -45,6 +65,7 @@ __all__ = [
     "handle_memory_create_event",
     "handle_memory_retrieve",
     "handle_memory_delete",
+    "handle_memory_pipeline",
     # Gateway handlers
     "handle_gateway_create",
     "handle_gateway_add_lambda_target",
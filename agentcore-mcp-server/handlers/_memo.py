@@ -0,0 +1,44 @@
+"""
+Result caching for script-generation handlers.
+
+Handlers are pure functions of their arguments, so a repeated request (common
+while a client iterates on a script) can be answered from a cache.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict
+import json
+
+
+def memoize_by_args(maxsize: int = 256, copy: Callable[[Dict], Any] = dict) -> Callable:
+    """Cache an async handler's result per JSON-encoded argument set (LRU).
+
+    Callers get copy(result), a shallow copy by default, which is enough when
+    the values are strings; pass copy=deepcopy for nested results. Exceptions
+    are not cached, and arguments that can't be JSON-encoded bypass the cache.
+    """
+    def decorator(handler: Callable[[Dict], Awaitable[Dict]]) -> Callable[[Dict], Awaitable[Dict]]:
+        cache: "OrderedDict[str, Dict]" = OrderedDict()
+
+        @wraps(handler)
+        async def wrapper(args: Dict) -> Dict:
+            try:
+                key = json.dumps(args, sort_keys=True)
+            except (TypeError, ValueError):
+                return await handler(args)
+
+            result = cache.get(key)
+            if result is None:
+                result = await handler(args)
+                cache[key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            return copy(result)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
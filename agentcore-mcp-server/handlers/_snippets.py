@@ -0,0 +1,57 @@
+"""
+Script fragments and JSON literals shared by several handler modules.
+
+Fragments are plain text with single braces, so they can be spliced into an
+f-string template as a value or concatenated into a string.Template.
+"""
+
+import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_LEADING_SPACES = re.compile(r"^( +)", re.MULTILINE)
+
+
+def pretty_json(obj, indent: int = 4) -> str:
+    """json.dumps(obj, indent=indent) equivalent (2 or 4), using orjson when installed"""
+    if orjson is None:
+        return json.dumps(obj, indent=indent, ensure_ascii=False)
+    try:
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    except orjson.JSONEncodeError:
+        # e.g. ints beyond 64 bits, which json.dumps accepts
+        return json.dumps(obj, indent=indent, ensure_ascii=False)
+    if indent == 2:
+        return text
+    # orjson only indents by 2; JSON strings can't span lines, so every
+    # leading run of spaces is indentation and can simply be doubled
+    return _LEADING_SPACES.sub(r"\1\1", text)
+
+
+def load_config_or_exit(path: str, label: str, var: str = "config", then: str = "") -> str:
+    """Lines that load a JSON config for a rerunnable delete script.
+
+    A missing or unreadable file means there is nothing to delete, so the
+    script exits cleanly instead of failing. Any line given in then runs
+    inside the same try (e.g. pulling a required key out of the config).
+    """
+    extra = f"\n        {then}" if then else ""
+    return f'''# Check if {label} config exists
+if not os.path.exists({path!r}):
+    print("⚠️  {label.capitalize()} config not found - nothing to delete")
+    print("✓ Script completed successfully (no resources to delete)")
+    exit(0)
+
+# Load {label} configuration
+try:
+    with open({path!r}) as f:
+        {var} = json.load(f){extra}
+except Exception as e:
+    print(f"⚠️  Failed to load {label} config: {{e}}")
+    print("✓ Script completed successfully (no resources to delete)")
+    exit(0)
+'''
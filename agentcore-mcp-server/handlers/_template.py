@@ -0,0 +1,77 @@
+"""
+Script templates shared by the handler modules.
+
+Template text lives in the handler modules as string constants. ScriptTemplate
+splits it into str chunks at import, so reading it from memory-mapped files
+instead would still end up as private str objects in each process.
+"""
+
+from string import Template
+
+
+# Script templates are parsed once at import; handlers only substitute values.
+# string.Template ($name placeholders) is used instead of a template engine such
+# as Jinja2 because the generated scripts are full of f-string braces that would
+# otherwise need escaping, and it needs no extra dependency.
+
+class ScriptTemplate(Template):
+    """string.Template that splits its static text around the placeholders once,
+    so substitute() is a single join of precomputed chunks"""
+    
+    def __init__(self, template):
+        super().__init__(template)
+        self._chunks = []
+        self._names = []
+        text, pos = [], 0
+        for match in self.pattern.finditer(template):
+            text.append(template[pos:match.start()])
+            pos = match.end()
+            name = match.group("named") or match.group("braced")
+            if name is None:
+                # "$$" escape (or a stray "$") stays literal text
+                text.append(match.group(0)[:1])
+                continue
+            self._chunks.append("".join(text))
+            self._names.append(name)
+            text = []
+        text.append(template[pos:])
+        self._chunks.append("".join(text))
+    
+    def partial(self, **values):
+        """Return a template with the given placeholders already filled in.
+
+        Their values are merged into the neighbouring static chunks, so the
+        remaining substitution only joins the pieces that still vary.
+        """
+        chunks, names = [self._chunks[0]], []
+        for name, chunk in zip(self._names, self._chunks[1:]):
+            if name in values:
+                chunks[-1] += str(values[name]) + chunk
+            else:
+                names.append(name)
+                chunks.append(chunk)
+        specialized = object.__new__(type(self))
+        # Keep .template in step with the chunks, so the inherited Template
+        # methods (get_identifiers, is_valid) see the specialized text
+        text = [chunks[0].replace("$", "$$")]
+        for name, chunk in zip(names, chunks[1:]):
+            text.append(f"${{{name}}}" + chunk.replace("$", "$$"))
+        specialized.template = "".join(text)
+        specialized._chunks = chunks
+        specialized._names = names
+        return specialized
+    
+    def substitute(self, **values):
+        parts = [self._chunks[0]]
+        for name, chunk in zip(self._names, self._chunks[1:]):
+            parts.append(str(values[name]))
+            parts.append(chunk)
+        return "".join(parts)
+    
+    def safe_substitute(self, **values):
+        """Like substitute(), but placeholders without a value stay as ${name}"""
+        parts = [self._chunks[0]]
+        for name, chunk in zip(self._names, self._chunks[1:]):
+            parts.append(str(values[name]) if name in values else f"${{{name}}}")
+            parts.append(chunk)
+        return "".join(parts)
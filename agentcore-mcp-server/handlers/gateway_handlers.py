@@ -2,12 +2,52 @@
 AgentCore Gateway Handlers
 
 Implementation of Gateway tool handlers for generating gateway operation scripts.
+Each generated script creates its control plane client once, up front, and
+reuses it for every call it makes (including the per-target delete loop).
+Caller-supplied strings are inlined as repr() literals, so quotes, braces or
+newlines in a name or description can't break the generated source.
 """
 
 from typing import Dict
 import json
+import string
 
+from ._memo import memoize_by_args
+from ._snippets import load_config_or_exit
 
+# Lower-cases ASCII letters and turns spaces into underscores in one pass
+_FILENAME_TABLE = str.maketrans(string.ascii_uppercase + " ", string.ascii_lowercase + "_")
+
+
+def _slug(name: str) -> str:
+    """name.lower().replace(' ', '_'), as a single translate for ASCII names"""
+    if name.isascii():
+        return name.translate(_FILENAME_TABLE)
+    return name.lower().replace(" ", "_")
+
+
+# Shared script fragments. Every generated script that works on an existing
+# gateway starts the same way: read gateway_config.json, then create the
+# control plane client. They are kept here once and spliced into each template.
+_LOAD_GATEWAY_CONFIG = """# Load configuration
+with open('gateway_config.json') as f:
+    gateway_config = json.load(f)
+
+"""
+
+# Delete scripts are rerunnable, so a missing or unreadable config is a no-op
+_LOAD_GATEWAY_CONFIG_OR_EXIT = load_config_or_exit('gateway_config.json', 'gateway', 'gateway_config') + "\n"
+
+
+def _gateway_client(region: str) -> str:
+    """Script lines creating the gateway control plane client"""
+    return (
+        "# Initialize AgentCore control plane client\n"
+        f"gateway_client = boto3.client(\"bedrock-agentcore-control\", region_name={region!r})\n"
+    )
+
+
+@memoize_by_args()
 async def handle_gateway_create(args: Dict) -> Dict:
     """Generate script to create AgentCore Gateway with OAuth authentication"""
     
@@ -24,7 +64,9 @@ async def handle_gateway_create(args: Dict) -> Dict:
     if protocol_type != "MCP":
         raise ValueError("Only MCP protocol is supported in this handler")
     
-    # Generate Python script code
+    # Generate Python script code. The two config files it reads are a few
+    # hundred bytes each, so they are loaded one after the other: threads or
+    # asyncio would cost more to start than the reads themselves take.
     code = f'''#!/usr/bin/env python3
 """
 Script to create AgentCore Gateway.
@@ -44,7 +86,7 @@ with open('gateway_role_config.json') as f:
     role_config = json.load(f)
 
 # Initialize AgentCore control plane client
-gateway_client = boto3.client("bedrock-agentcore-control", region_name='{region}')
+gateway_client = boto3.client("bedrock-agentcore-control", region_name={region!r})
 
 # Build auth configuration for Cognito JWT
 auth_config = {{
@@ -57,12 +99,12 @@ auth_config = {{
 # Create gateway
 print("Creating AgentCore Gateway...")
 create_response = gateway_client.create_gateway(
-    name="{name}",
+    name={name!r},
     roleArn=role_config["role_arn"],
-    protocolType="{protocol_type}",
-    authorizerType="{authorizer_type}",
+    protocolType={protocol_type!r},
+    authorizerType={authorizer_type!r},
     authorizerConfiguration=auth_config,
-    description="{description}"
+    description={description!r}
 )
 
 # Extract gateway details
@@ -76,8 +118,8 @@ config = {{
     "gateway_id": gateway_id,  # Keep for backward compatibility
     "gateway_url": gateway_url,
     "gateway_arn": gateway_arn,
-    "name": "{name}",
-    "region": "{region}"
+    "name": {name!r},
+    "region": {region!r}
 }}
 
 with open('gateway_config.json', 'w') as f:
@@ -91,11 +133,12 @@ print(f"✓ Configuration saved to gateway_config.json")
     
     return {
         "code": code,
-        "filename": f"{name.lower().replace(' ', '_')}_gateway_create.py",
+        "filename": f"{_slug(name)}_gateway_create.py",
         "instructions": f"Ensure cognito_config.json and gateway_role_config.json exist, then run this script to create the AgentCore Gateway '{name}'"
     }
 
 
+@memoize_by_args()
 async def handle_gateway_add_lambda_target(args: Dict) -> Dict:
     """Generate script to add Lambda function as gateway target
     
@@ -110,6 +153,12 @@ async def handle_gateway_add_lambda_target(args: Dict) -> Dict:
     tool_schema = args["tool_schema"]
     target_description = args.get("target_description", "")
     
+    # Inline the schema as a JSON string parsed when the script runs: a large
+    # schema stays one string constant instead of a nested literal the compiler
+    # has to build, and JSON true/false/null don't need translating to Python
+    schema_json = json.dumps(tool_schema, indent=4)
+    schema_literal = f"r'''{schema_json}'''" if "'''" not in schema_json else repr(schema_json)
+    
     # Generate Python script code with inlined values
     code = f'''#!/usr/bin/env python3
 """
@@ -122,16 +171,11 @@ Prerequisites:
 import json
 import boto3
 
-# Load gateway configuration
-with open('gateway_config.json') as f:
-    gateway_config = json.load(f)
-
-# Initialize AgentCore control plane client
-gateway_client = boto3.client("bedrock-agentcore-control", region_name='{region}')
-
-# Lambda ARN and tool schema (inlined from MCP call)
-lambda_arn = "{lambda_arn}"
-tool_schema = {json.dumps(tool_schema, indent=4)}
+{_LOAD_GATEWAY_CONFIG}{_gateway_client(region)}
+# Target name, Lambda ARN and tool schema (inlined from MCP call)
+target_name = {target_name!r}
+lambda_arn = {lambda_arn!r}
+tool_schema = json.loads({schema_literal})
 
 # Build Lambda target configuration with MCP protocol
 lambda_target_config = {{
@@ -151,13 +195,13 @@ credential_config = [{{"credentialProviderType": "GATEWAY_IAM_ROLE"}}]
 # Create target
 print("Adding Lambda target to gateway...")
 print(f"  Gateway ID: {{gateway_config['gateway_id']}}")
-print(f"  Target Name: {target_name}")
+print(f"  Target Name: {{target_name}}")
 print(f"  Lambda ARN: {{lambda_arn}}")
 
 create_response = gateway_client.create_gateway_target(
     gatewayIdentifier=gateway_config["gateway_id"],
-    name="{target_name}",
-    description="{target_description}",
+    name=target_name,
+    description={target_description!r},
     targetConfiguration=lambda_target_config,
     credentialProviderConfigurations=credential_config
 )
@@ -166,16 +210,17 @@ target_id = create_response["targetId"]
 
 print(f"\\n✓ Lambda target added successfully!")
 print(f"  Target ID: {{target_id}}")
-print(f"  Target Name: {target_name}")
+print(f"  Target Name: {{target_name}}")
 '''
     
     return {
         "code": code,
-        "filename": f"add_{target_name.lower().replace(' ', '_')}_target.py",
+        "filename": f"add_{_slug(target_name)}_target.py",
         "instructions": f"Ensure gateway_config.json exists, then run this script to add Lambda target '{target_name}' to the gateway"
     }
 
 
+@memoize_by_args()
 async def handle_gateway_list_targets(args: Dict) -> Dict:
     """Generate script to list all targets attached to a gateway
     
@@ -197,13 +242,7 @@ Prerequisites:
 import json
 import boto3
 
-# Load configuration
-with open('gateway_config.json') as f:
-    gateway_config = json.load(f)
-
-# Initialize AgentCore control plane client
-gateway_client = boto3.client("bedrock-agentcore-control", region_name='{region}')
-
+{_LOAD_GATEWAY_CONFIG}{_gateway_client(region)}
 # List targets using correct API method
 print(f"Listing targets for gateway: {{gateway_config['gateway_id']}}")
 response = gateway_client.list_gateway_targets(
@@ -227,6 +266,7 @@ for i, target in enumerate(targets, 1):
     }
 
 
+@memoize_by_args()
 async def handle_gateway_delete_target(args: Dict) -> Dict:
     """Generate script to delete a target from gateway
     
@@ -255,42 +295,25 @@ import boto3
 
 print("Deleting gateway target...")
 
-# Check if gateway config exists
-if not os.path.exists('gateway_config.json'):
-    print("⚠️  Gateway config not found - nothing to delete")
-    print("✓ Script completed successfully (no resources to delete)")
-    exit(0)
-
-# Load configuration
-try:
-    with open('gateway_config.json') as f:
-        gateway_config = json.load(f)
-except Exception as e:
-    print(f"⚠️  Failed to load gateway config: {{e}}")
-    print("✓ Script completed successfully (no resources to delete)")
-    exit(0)
-
-# Initialize AgentCore control plane client
-gateway_client = boto3.client("bedrock-agentcore-control", region_name='{region}')
+target_id = {target_id!r}
 
+{_LOAD_GATEWAY_CONFIG_OR_EXIT}{_gateway_client(region)}
 # Delete target using correct API method name
 try:
     print(f"  Gateway ID: {{gateway_config['gateway_id']}}")
-    print(f"  Target ID: {target_id}")
+    print(f"  Target ID: {{target_id}}")
     
     gateway_client.delete_gateway_target(
         gatewayIdentifier=gateway_config["gateway_id"],
-        targetId="{target_id}"
+        targetId=target_id
     )
     print("✓ Gateway target deleted successfully!")
+except gateway_client.exceptions.ResourceNotFoundException:
+    print("⚠️  Target already deleted or not found")
+    print("✓ Script completed successfully (resource already removed)")
 except Exception as e:
-    error_msg = str(e).lower()
-    if "resourcenotfound" in error_msg or "not found" in error_msg:
-        print("⚠️  Target already deleted or not found")
-        print("✓ Script completed successfully (resource already removed)")
-    else:
-        print(f"✗ Error deleting target: {{e}}")
-        exit(1)
+    print(f"✗ Error deleting target: {{e}}")
+    exit(1)
 
 print("\\n✓ Target deletion completed successfully")
 print("✓ This script is RERUNNABLE - you can safely run it multiple times.")
@@ -303,14 +326,16 @@ print("✓ This script is RERUNNABLE - you can safely run it multiple times.")
     }
 
 
+@memoize_by_args()
 async def handle_gateway_delete(args: Dict) -> Dict:
     """Generate script to delete AgentCore Gateway
     
-    Note: gateway_id is loaded from gateway_config.json in the generated script
+    Note: gateway_id is loaded from gateway_config.json in the generated script.
+    Target deletes run concurrently on a thread pool; the remaining calls
+    depend on each other, so the script uses plain boto3 rather than aioboto3.
     """
     
     region = args.get("region", "us-west-2")
-    # gateway_id loaded from config file in generated script
     
     # Generate Python script code
     code = f'''#!/usr/bin/env python3
@@ -326,83 +351,84 @@ Prerequisites:
 
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import boto3
 
 print("=" * 80)
 print("Delete AgentCore Gateway")
 print("=" * 80)
 
-# Check if gateway config exists
-if not os.path.exists('gateway_config.json'):
-    print("⚠️  Gateway config not found - nothing to delete")
-    print("✓ Script completed successfully (no resources to delete)")
-    exit(0)
-
-# Load configuration
-try:
-    with open('gateway_config.json') as f:
-        gateway_config = json.load(f)
-except Exception as e:
-    print(f"⚠️  Failed to load gateway config: {{e}}")
-    print("✓ Script completed successfully (no resources to delete)")
-    exit(0)
-
-# Initialize AgentCore control plane client
-gateway_client = boto3.client("bedrock-agentcore-control", region_name='{region}')
-
+{_LOAD_GATEWAY_CONFIG_OR_EXIT}{_gateway_client(region)}
 print(f"\\nGateway ID: {{gateway_config['gateway_id']}}")
 
 # Step 1: Delete all targets first
 print("\\nStep 1: Deleting gateway targets...")
 try:
     response = gateway_client.list_gateway_targets(gatewayIdentifier=gateway_config["gateway_id"])
-    targets = response.get('items', [])
+    targets = response.get('items') or []
     
     if targets:
-        for target in targets:
-            try:
-                gateway_client.delete_gateway_target(
+        # Display name per target ID, resolved once up front
+        target_names = {{t['targetId']: t.get('name') or t['targetId'] for t in targets}}
+        # Targets are independent, so delete them concurrently
+        errors = []
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = {{
+                executor.submit(
+                    gateway_client.delete_gateway_target,
                     gatewayIdentifier=gateway_config["gateway_id"],
-                    targetId=target['targetId']
-                )
-                print(f"✓ Deleted target: {{target.get('name', target['targetId'])}}")
-            except Exception as e:
-                if "ResourceNotFound" in str(e) or "not found" in str(e).lower():
-                    print(f"⚠️  Target already deleted: {{target.get('name', target['targetId'])}}")
-                else:
+                    targetId=target_id
+                ): target_id
+                for target_id in target_names
+            }}
+            for future in as_completed(futures):
+                target_name = target_names[futures[future]]
+                try:
+                    future.result()
+                    print(f"✓ Deleted target: {{target_name}}")
+                except gateway_client.exceptions.ResourceNotFoundException:
+                    print(f"⚠️  Target already deleted: {{target_name}}")
+                except Exception as e:
                     print(f"✗ Error deleting target: {{e}}")
-                    raise  # Re-raise to prevent gateway deletion
+                    errors.append(e)
+        if errors:
+            raise errors[0]  # Re-raise to prevent gateway deletion
     else:
         print("⚠️  No targets found")
+except gateway_client.exceptions.ResourceNotFoundException:
+    print("⚠️  Gateway not found (may already be deleted)")
 except Exception as e:
-    if "ResourceNotFound" in str(e) or "not found" in str(e).lower():
-        print("⚠️  Gateway not found (may already be deleted)")
-    else:
-        print(f"⚠️  Could not delete targets: {{e}}")
-        raise  # Re-raise to prevent gateway deletion
+    print(f"⚠️  Could not delete targets: {{e}}")
+    raise  # Re-raise to prevent gateway deletion
 
 # Step 1.5: Verify all targets are deleted
 print("\\nStep 1.5: Verifying targets are deleted...")
 try:
-    response = gateway_client.list_gateway_targets(gatewayIdentifier=gateway_config["gateway_id"])
-    remaining_targets = response.get('items', [])
-    if remaining_targets:
-        print(f"⚠️  Warning: {{len(remaining_targets)}} target(s) still exist. Waiting 5 seconds...")
-        import time
-        time.sleep(5)
-        # Check again
+    # Poll with exponential backoff (0.1s doubling, ~12s in total) until the
+    # deletions have propagated
+    delay = 0.1
+    for attempt in range(8):
         response = gateway_client.list_gateway_targets(gatewayIdentifier=gateway_config["gateway_id"])
-        remaining_targets = response.get('items', [])
-        if remaining_targets:
-            print(f"✗ Error: {{len(remaining_targets)}} target(s) still exist after waiting")
-            for target in remaining_targets:
-                print(f"  - {{target.get('name', target['targetId'])}} ({{target['targetId']}})")
-            print("\\nPlease wait a few moments and run this script again.")
-            exit(1)
+        remaining_targets = response.get('items') or []
+        if not remaining_targets or attempt == 7:
+            break
+        if attempt == 0:
+            print(f"⚠️  Warning: {{len(remaining_targets)}} target(s) still exist. Waiting for deletion to complete...")
+        time.sleep(delay)
+        delay *= 2
+    if remaining_targets:
+        print(f"✗ Error: {{len(remaining_targets)}} target(s) still exist after waiting")
+        for target in remaining_targets:
+            target_id = target['targetId']
+            print(f"  - {{target.get('name') or target_id}} ({{target_id}})")
+        print("\\nPlease wait a few moments and run this script again.")
+        exit(1)
     print("✓ All targets confirmed deleted")
+except gateway_client.exceptions.ResourceNotFoundException:
+    pass  # Gateway already gone, so no targets remain
 except Exception as e:
-    if "ResourceNotFound" not in str(e) and "not found" not in str(e).lower():
-        print(f"⚠️  Could not verify targets: {{e}}")
+    print(f"⚠️  Could not verify targets: {{e}}")
 
 # Step 2: Delete gateway
 print("\\nStep 2: Deleting gateway...")
@@ -411,14 +437,12 @@ try:
         gatewayIdentifier=gateway_config["gateway_id"]
     )
     print("✓ Gateway deleted successfully!")
+except gateway_client.exceptions.ResourceNotFoundException:
+    print("⚠️  Gateway already deleted or not found")
+    print("✓ Script completed successfully (resource already removed)")
 except Exception as e:
-    error_msg = str(e).lower()
-    if "resourcenotfound" in error_msg or "not found" in error_msg:
-        print("⚠️  Gateway already deleted or not found")
-        print("✓ Script completed successfully (resource already removed)")
-    else:
-        print(f"✗ Error deleting gateway: {{e}}")
-        exit(1)
+    print(f"✗ Error deleting gateway: {{e}}")
+    exit(1)
 
 print("\\n" + "=" * 80)
 print("✓ Gateway deletion completed successfully")
@@ -431,4 +455,3 @@ print("=" * 80)
         "filename": "delete_gateway.py",
         "instructions": "Ensure gateway_config.json exists, then run this script to delete the AgentCore Gateway and all its targets"
     }
-
@@ -5,8 +5,26 @@ Implementation of handlers for generating IAM role and Cognito resource creation
 """
 
 from typing import Dict
+import json
+
+from ._memo import memoize_by_args
+
+# Trust policy for bedrock-agentcore.amazonaws.com, serialized once for all scripts
+_TRUST_POLICY_JSON = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {
+                "Service": "bedrock-agentcore.amazonaws.com"
+            },
+            "Action": "sts:AssumeRole"
+        }
+    ]
+})
 
 
+@memoize_by_args()
 async def handle_create_runtime_execution_role_script(args: Dict) -> Dict:
     """Generate script to create IAM execution role for AgentCore Runtime"""
     
@@ -26,7 +44,7 @@ import boto3
 import time
 
 # Configuration
-REGION = "{region}"
+REGION = {region!r}
 ROLE_NAME = f"AgentCoreRuntimeExecutionRole-{{int(time.time())}}"
 POLICY_NAME = f"AgentCoreRuntimePolicy-{{int(time.time())}}"
 
@@ -42,25 +60,19 @@ account_id = sts_client.get_caller_identity()['Account']
 print(f"\\nAWS Account: {{account_id}}")
 print(f"Region: {{REGION}}")
 
-# Step 1: Define trust policy for bedrock-agentcore.amazonaws.com
+# ARN prefixes shared by several policy resources below
+logs_arn_prefix = f"arn:aws:logs:{{REGION}}:{{account_id}}"
+agentcore_arn_prefix = f"arn:aws:bedrock-agentcore:{{REGION}}:{{account_id}}"
+
+# Step 1: Create role with trust policy for bedrock-agentcore.amazonaws.com
+# (the trust policy has no account-specific values, so it is emitted pre-serialized)
 print("\\n1. Creating IAM role with trust policy...")
-trust_policy = {{
-    "Version": "2012-10-17",
-    "Statement": [
-        {{
-            "Effect": "Allow",
-            "Principal": {{
-                "Service": "bedrock-agentcore.amazonaws.com"
-            }},
-            "Action": "sts:AssumeRole"
-        }}
-    ]
-}}
+TRUST_POLICY_JSON = {_TRUST_POLICY_JSON!r}
 
 try:
     role_response = iam_client.create_role(
         RoleName=ROLE_NAME,
-        AssumeRolePolicyDocument=json.dumps(trust_policy),
+        AssumeRolePolicyDocument=TRUST_POLICY_JSON,
         Description="Execution role for AgentCore Runtime with minimal required permissions"
     )
     role_arn = role_response['Role']['Arn']
@@ -97,8 +109,8 @@ permissions_policy = {{
                 "logs:DescribeLogGroups"
             ],
             "Resource": [
-                f"arn:aws:logs:{{REGION}}:{{account_id}}:log-group:/aws/bedrock-agentcore/*",
-                f"arn:aws:logs:{{REGION}}:{{account_id}}:log-group:*"
+                logs_arn_prefix + ":log-group:/aws/bedrock-agentcore/*",
+                logs_arn_prefix + ":log-group:*"
             ]
         }},
         {{
@@ -148,7 +160,7 @@ permissions_policy = {{
                 "bedrock-agentcore:RetrieveMemoryRecords",
                 "bedrock-agentcore:ListMemoryRecords"
             ],
-            "Resource": f"arn:aws:bedrock-agentcore:{{REGION}}:{{account_id}}:*"
+            "Resource": agentcore_arn_prefix + ":*"
         }},
         {{
             "Sid": "WorkloadIdentityAccess",
@@ -159,8 +171,8 @@ permissions_policy = {{
                 "bedrock-agentcore:GetWorkloadAccessTokenForUserId"
             ],
             "Resource": [
-                f"arn:aws:bedrock-agentcore:{{REGION}}:{{account_id}}:workload-identity-directory/default",
-                f"arn:aws:bedrock-agentcore:{{REGION}}:{{account_id}}:workload-identity-directory/default/workload-identity/*"
+                agentcore_arn_prefix + ":workload-identity-directory/default",
+                agentcore_arn_prefix + ":workload-identity-directory/default/workload-identity/*"
             ]
         }},
         {{
@@ -4,43 +4,28 @@ AgentCore Memory Handlers
 Implementation of Memory tool handlers for generating memory operation scripts.
 """
 
-from typing import Dict
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+import base64
+import importlib.util
 import json
+import marshal
+import sys
 
+from ._snippets import load_config_or_exit, pretty_json
+from ._template import ScriptTemplate
 
-async def handle_memory_create(args: Dict) -> Dict:
-    """Generate script to create AgentCore Memory with strategies"""
-    
-    region = args.get("region", "us-west-2")
-    name = args["name"]
-    description = args.get("description", "")
-    strategies = args["strategies"]
-    
-    # Transform strategies to boto3 tagged union format
-    # Input format: [{"name": "summary", "namespaces": [...]}]
-    # Output format: [{"summaryMemoryStrategy": {"name": "summary", "namespaces": [...]}}]
-    transformed_strategies = []
-    for strategy in strategies:
-        strategy_name = strategy.get("name", "").lower()
-        
-        if strategy_name == "summary":
-            transformed_strategies.append({
-                "summaryMemoryStrategy": strategy
-            })
-        elif strategy_name == "preferences":
-            transformed_strategies.append({
-                "userPreferenceMemoryStrategy": strategy
-            })
-        elif strategy_name == "semantic":
-            transformed_strategies.append({
-                "semanticMemoryStrategy": strategy
-            })
-        else:
-            # Unknown strategy type - pass through as-is
-            transformed_strategies.append(strategy)
-    
-    # Generate Python script code
-    code = f'''#!/usr/bin/env python3
+
+# Shared preamble for scripts that act on the memory from memory_config.json
+_LOAD_MEMORY_ID = '''# Load memory_id from config
+with open('memory_config.json') as f:
+    config = json.load(f)
+    memory_id = config['memory_id']
+
+print(f"Using Memory ID: {memory_id}")
+'''
+
+_MEMORY_CREATE_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
 """
 Script to create AgentCore Memory.
 
@@ -51,16 +36,16 @@ import json
 from bedrock_agentcore_starter_toolkit.operations.memory.manager import MemoryManager
 
 # Define memory strategies in boto3 tagged union format
-strategies = {json.dumps(transformed_strategies, indent=4)}
+strategies = $strategies_json
 
 # Create memory manager
-memory_manager = MemoryManager(region_name='{region}')
+memory_manager = MemoryManager(region_name=$region)
 
 # Create memory
 print("Creating AgentCore Memory...")
 memory = memory_manager.get_or_create_memory(
-    name="{name}",
-    description="{description}",
+    name=$name,
+    description=$description,
     strategies=strategies
 )
 
@@ -68,42 +53,29 @@ memory = memory_manager.get_or_create_memory(
 memory_id = memory["id"]
 
 # Save memory_id to config file
-config = {{
+config = {
     "memory_id": memory_id,
-    "name": "{name}",
-    "region": "{region}"
-}}
+    "name": $name,
+    "region": $region
+}
 
 with open('memory_config.json', 'w') as f:
     json.dump(config, f, indent=2)
 
 print(f"✓ Memory created successfully!")
-print(f"  Memory ID: {{memory_id}}")
+print(f"  Memory ID: {memory_id}")
 print(f"✓ Configuration saved to memory_config.json")
-'''
-    
-    return {
-        "code": code,
-        "filename": f"{name.replace(' ', '_')}_create.py",
-        "instructions": f"Run this script to create the AgentCore Memory resource '{name}'"
-    }
-
+''')
 
-async def handle_memory_create_event(args: Dict) -> Dict:
-    """Generate script to store conversation messages in Memory"""
-    
-    region = args.get("region", "us-west-2")
-    memory_id = args["memory_id"]
-    actor_id = args["actor_id"]
-    session_id = args["session_id"]
-    messages = args["messages"]
-    
-    # Generate Python script code
-    code = f'''#!/usr/bin/env python3
+_MEMORY_CREATE_EVENT_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
 """
 Script to store conversation messages in AgentCore Memory.
+
+Options:
+  --wait N  Wait N seconds for memory processing before exiting (default: 0)
 """
 
+import argparse
 import json
 import time
 
@@ -114,58 +86,42 @@ except ImportError:
     print("  Install with: pip install bedrock-agentcore")
     exit(1)
 
-# Load memory_id from config
-with open('memory_config.json') as f:
-    config = json.load(f)
-    memory_id = config['memory_id']
-
-print(f"Using Memory ID: {{memory_id}}")
+# Parse command line options
+parser = argparse.ArgumentParser(description="Store conversation messages in AgentCore Memory")
+parser.add_argument("--wait", type=int, default=0,
+                    help="Seconds to wait for memory processing before exiting (default: 0)")
+cli_args = parser.parse_args()
 
+''' + _LOAD_MEMORY_ID + '''
 # Create memory client
-memory_client = MemoryClient(region_name='{region}')
+memory_client = MemoryClient(region_name=$region)
 
 # Define messages
-messages = {json.dumps(messages, indent=4)}
+messages = $messages_json
 
 # Normalize message format to match notebook expectations
 for m in messages:
     if isinstance(m.get("content"), str):
-        m["content"] = [{{"text": m["content"]}}]
+        m["content"] = [{"text": m["content"]}]
 
 # Store messages
 print("Storing messages in memory...")
 memory_client.create_event(
     memory_id=memory_id,
-    actor_id="{actor_id}",
-    session_id="{session_id}",
+    actor_id=$actor_id,
+    session_id=$session_id,
     messages=messages
 )
 
-print(f"✓ Stored {{len(messages)}} messages successfully!")
+print(f"✓ Stored {len(messages)} messages successfully!")
 print("\\nNote: Memory processing takes 20-30 seconds to extract preferences, facts, and summaries.")
-print("Waiting 30 seconds for memory processing...")
-time.sleep(30)
-print("✓ Memory processing complete!")
-'''
-    
-    return {
-        "code": code,
-        "filename": f"store_memory_event_{actor_id}.py",
-        "instructions": f"Run this script to store conversation messages for {actor_id}"
-    }
+if cli_args.wait > 0:
+    print(f"Waiting {cli_args.wait} seconds for memory processing...")
+    time.sleep(cli_args.wait)
+    print("✓ Memory processing complete!")
+''')
 
-
-async def handle_memory_retrieve(args: Dict) -> Dict:
-    """Generate script to retrieve memories from Memory"""
-    
-    region = args.get("region", "us-west-2")
-    memory_id = args["memory_id"]
-    namespace = args["namespace"]
-    query = args["query"]
-    top_k = args.get("top_k", 3)
-    
-    # Generate Python script code
-    code = f'''#!/usr/bin/env python3
+_MEMORY_RETRIEVE_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
 """
 Script to retrieve memories from AgentCore Memory.
 """
@@ -179,76 +135,179 @@ except ImportError:
     print("  Install with: pip install bedrock-agentcore")
     exit(1)
 
-# Load memory_id from config
-with open('memory_config.json') as f:
-    config = json.load(f)
-    memory_id = config['memory_id']
-
-print(f"Using Memory ID: {{memory_id}}")
-
+''' + _LOAD_MEMORY_ID + '''
 # Create memory client
-memory_client = MemoryClient(region_name='{region}')
+memory_client = MemoryClient(region_name=$region)
 
 # Retrieve memories using the correct API method
+namespace = $namespace
+query = $query
 print(f"Retrieving memories from namespace: {namespace}")
 print(f"Search query: {query}")
-print(f"Top K: {top_k}")
+print(f"Top K: $top_k")
 print()
 
 try:
     # Use retrieve_memories() method with correct parameters
     memories = memory_client.retrieve_memories(
         memory_id=memory_id,
-        namespace="{namespace}",
-        query="{query}",
-        top_k={top_k}
+        namespace=namespace,
+        query=query,
+        top_k=$top_k
     )
     
     if memories:
-        print(f"✓ Retrieved {{len(memories)}} memories from '{namespace}' namespace")
+        print(f"✓ Retrieved {len(memories)} memories from '{namespace}' namespace")
         print()
         
         for i, memory in enumerate(memories, 1):
-            print(f"Memory {{i}}:")
+            print(f"Memory {i}:")
             print(f"─────────────────────────────────────────")
-            content = memory.get('content', {{}})
+            content = memory.get('content', {})
             if isinstance(content, dict):
                 text = content.get('text', 'N/A')
             else:
                 text = str(content)
-            print(f"Content: {{text}}")
+            print(f"Content: {text}")
             
             # Safe formatting for relevance score
             relevance = memory.get('relevanceScore', 'N/A')
             if isinstance(relevance, (int, float)):
-                print(f"Relevance Score: {{relevance:.3f}}")
+                print(f"Relevance Score: {relevance:.3f}")
             else:
-                print(f"Relevance Score: {{relevance}}")
+                print(f"Relevance Score: {relevance}")
             print()
     else:
         print("⚠️  No memories found")
         print("Memory extraction may still be processing (takes 20-30 seconds)")
         
 except Exception as e:
-    print(f"❌ Error retrieving memories: {{e}}")
+    print(f"❌ Error retrieving memories: {e}")
     exit(1)
-'''
+''')
+
+# aioboto3 variants of the event/retrieve scripts (async_io=True)
+_MEMORY_CREATE_EVENT_ASYNC_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
+"""
+Script to store conversation messages in AgentCore Memory (async, aioboto3).
+
+Options:
+  --wait N  Wait N seconds for memory processing before exiting (default: 0)
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import datetime, timezone
+
+try:
+    import aioboto3
+except ImportError:
+    print("✗ Error: aioboto3 package not found")
+    print("  Install with: pip install aioboto3")
+    exit(1)
+
+# Parse command line options
+parser = argparse.ArgumentParser(description="Store conversation messages in AgentCore Memory")
+parser.add_argument("--wait", type=int, default=0,
+                    help="Seconds to wait for memory processing before exiting (default: 0)")
+cli_args = parser.parse_args()
+
+''' + _LOAD_MEMORY_ID + '''
+# Define messages as (text, role) pairs
+messages = $messages_json
+
+
+async def main():
+    session = aioboto3.Session()
+    async with session.client("bedrock-agentcore", region_name=$region) as client:
+        # Store messages
+        print("Storing messages in memory...")
+        await client.create_event(
+            memoryId=memory_id,
+            actorId=$actor_id,
+            sessionId=$session_id,
+            eventTimestamp=datetime.now(timezone.utc),
+            payload=[
+                {"conversational": {"content": {"text": text}, "role": role.upper()}}
+                for text, role in messages
+            ]
+        )
     
-    return {
-        "code": code,
-        "filename": "retrieve_memories.py",
-        "instructions": f"Run this script to retrieve memories from namespace '{namespace}'"
-    }
+    print(f"✓ Stored {len(messages)} messages successfully!")
+    print("\\nNote: Memory processing takes 20-30 seconds to extract preferences, facts, and summaries.")
+    if cli_args.wait > 0:
+        print(f"Waiting {cli_args.wait} seconds for memory processing...")
+        await asyncio.sleep(cli_args.wait)
+        print("✓ Memory processing complete!")
 
 
-async def handle_memory_delete(args: Dict) -> Dict:
-    """Generate script to delete AgentCore Memory"""
+asyncio.run(main())
+''')
+
+_MEMORY_RETRIEVE_ASYNC_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
+"""
+Script to retrieve memories from AgentCore Memory (async, aioboto3).
+"""
+
+import asyncio
+import json
+
+try:
+    import aioboto3
+except ImportError:
+    print("✗ Error: aioboto3 package not found")
+    print("  Install with: pip install aioboto3")
+    exit(1)
+
+''' + _LOAD_MEMORY_ID + '''
+namespace = $namespace
+query = $query
+
+
+async def main():
+    print(f"Retrieving memories from namespace: {namespace}")
+    print(f"Search query: {query}")
+    print(f"Top K: $top_k")
+    print()
     
-    region = args.get("region", "us-west-2")
-    memory_id = args["memory_id"]
+    session = aioboto3.Session()
+    async with session.client("bedrock-agentcore", region_name=$region) as client:
+        response = await client.retrieve_memory_records(
+            memoryId=memory_id,
+            namespace=namespace,
+            searchCriteria={"searchQuery": query, "topK": $top_k}
+        )
+    memories = response.get("memoryRecordSummaries", [])
     
-    # Generate Python script code
-    code = f'''#!/usr/bin/env python3
+    if memories:
+        print(f"✓ Retrieved {len(memories)} memories from '{namespace}' namespace")
+        print()
+        
+        for i, memory in enumerate(memories, 1):
+            print(f"Memory {i}:")
+            print(f"─────────────────────────────────────────")
+            print(f"Content: {memory.get('content', {}).get('text', 'N/A')}")
+            
+            relevance = memory.get('score', 'N/A')
+            if isinstance(relevance, (int, float)):
+                print(f"Relevance Score: {relevance:.3f}")
+            else:
+                print(f"Relevance Score: {relevance}")
+            print()
+    else:
+        print("⚠️  No memories found")
+        print("Memory extraction may still be processing (takes 20-30 seconds)")
+
+
+try:
+    asyncio.run(main())
+except Exception as e:
+    print(f"❌ Error retrieving memories: {e}")
+    exit(1)
+''')
+
+_MEMORY_DELETE_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
 """
 Script to delete AgentCore Memory.
 
@@ -262,28 +321,13 @@ from bedrock_agentcore_starter_toolkit.operations.memory.manager import MemoryMa
 
 print("Deleting AgentCore Memory...")
 
-# Check if memory config exists
-if not os.path.exists('memory_config.json'):
-    print("⚠️  Memory config not found - nothing to delete")
-    print("✓ Script completed successfully (no resources to delete)")
-    exit(0)
-
-# Load memory_id from config
-try:
-    with open('memory_config.json') as f:
-        config = json.load(f)
-        memory_id = config['memory_id']
-except Exception as e:
-    print(f"⚠️  Failed to load memory config: {{e}}")
-    print("✓ Script completed successfully (no resources to delete)")
-    exit(0)
-
+''' + load_config_or_exit('memory_config.json', 'memory', then="memory_id = config['memory_id']") + '''
 # Create memory manager
-memory_manager = MemoryManager(region_name='{region}')
+memory_manager = MemoryManager(region_name=$region)
 
 # Delete memory
 try:
-    print(f"  Memory ID: {{memory_id}}")
+    print(f"  Memory ID: {memory_id}")
     memory_manager.delete_memory(memory_id=memory_id)
     print("✓ Memory deleted successfully!")
 except Exception as e:
@@ -292,15 +336,354 @@ except Exception as e:
         print("⚠️  Memory already deleted or not found")
         print("✓ Script completed successfully (resource already removed)")
     else:
-        print(f"✗ Error deleting memory: {{e}}")
+        print(f"✗ Error deleting memory: {e}")
         exit(1)
 
 print("\\n✓ Memory deletion completed successfully")
 print("✓ This script is RERUNNABLE - you can safely run it multiple times.")
+''')
+
+
+@lru_cache(maxsize=128)
+def _dump_indented(key: str, indent: int = 4) -> str:
+    """Pretty-print a JSON payload (given as compact JSON) for a generated script"""
+    return pretty_json(json.loads(key), indent)
+
+
+# Strategy name -> boto3 tagged union member
+_STRATEGY_WRAPPER = {
+    sys.intern(name): sys.intern(member)
+    for name, member in {
+        "summary": "summaryMemoryStrategy",
+        "preferences": "userPreferenceMemoryStrategy",
+        "semantic": "semanticMemoryStrategy",
+    }.items()
+}
+
+
+def _create_values(args: Dict) -> Dict:
+    """Template values for the memory create script"""
+    
+    # Transform strategies to boto3 tagged union format
+    # Input format: [{"name": "summary", "namespaces": [...]}]
+    # Output format: [{"summaryMemoryStrategy": {"name": "summary", "namespaces": [...]}}]
+    # Unknown strategy types pass through as-is
+    transformed_strategies = []
+    for strategy in args["strategies"]:
+        # Lower-case once and intern, so the lookup against the (interned)
+        # literal keys usually matches on identity
+        wrapper = _STRATEGY_WRAPPER.get(sys.intern(strategy.get("name", "").lower()))
+        transformed_strategies.append({wrapper: strategy} if wrapper else strategy)
+    
+    return {
+        "strategies_json": _dump_indented(json.dumps(transformed_strategies)),
+        "region": args.get("region", "us-west-2"),
+        "name": args["name"],
+        "description": args.get("description", "")
+    }
+
+
+def _create_event_values(args: Dict) -> Dict:
+    """Template values for the store-event script"""
+    return {
+        "region": args.get("region", "us-west-2"),
+        # Messages can run to dozens of turns, so keep them at a 2-space indent
+        "messages_json": _dump_indented(json.dumps(args["messages"]), 2),
+        "actor_id": args["actor_id"],
+        "session_id": args["session_id"]
+    }
+
+
+def _retrieve_values(args: Dict) -> Dict:
+    """Template values for the retrieve script"""
+    return {
+        "region": args.get("region", "us-west-2"),
+        "namespace": args["namespace"],
+        "query": args["query"],
+        "top_k": args.get("top_k", 3)
+    }
+
+
+def _delete_values(args: Dict) -> Dict:
+    """Template values for the delete script"""
+    return {"region": args.get("region", "us-west-2")}
+
+
+def _literals(values: Dict) -> Dict:
+    """Values as Python literals for the templates.
+
+    Strings are inlined as repr(), so quotes, backslashes or braces in a name
+    or query can't break the generated source; *_json values are already
+    literals. The raw values stay around for filenames and instructions.
+    """
+    return {
+        key: repr(value) if isinstance(value, str) and not key.endswith("_json") else value
+        for key, value in values.items()
+    }
+
+
+@lru_cache(maxsize=512)
+def _create_filename(name: str) -> str:
+    """Filename for the memory create script"""
+    return f"{name.replace(' ', '_')}_create.py"
+
+
+@lru_cache(maxsize=512)
+def _create_event_filename(actor_id: str) -> str:
+    """Filename for the store-event script"""
+    return f"store_memory_event_{actor_id}.py"
+
+
+# kind -> (template, aioboto3 template or None, values, filename, instructions)
+_HANDLERS: Dict[str, Tuple[ScriptTemplate, Optional[ScriptTemplate], Callable, Callable, Callable]] = {
+    "create": (
+        _MEMORY_CREATE_TEMPLATE,
+        None,
+        _create_values,
+        lambda values: _create_filename(values["name"]),
+        lambda values: f"Run this script to create the AgentCore Memory resource '{values['name']}'"
+    ),
+    "create_event": (
+        _MEMORY_CREATE_EVENT_TEMPLATE,
+        _MEMORY_CREATE_EVENT_ASYNC_TEMPLATE,
+        _create_event_values,
+        lambda values: _create_event_filename(values["actor_id"]),
+        lambda values: (f"Run this script to store conversation messages for {values['actor_id']} "
+                        "(pass --wait 30 to wait for memory processing before exiting)")
+    ),
+    "retrieve": (
+        _MEMORY_RETRIEVE_TEMPLATE,
+        _MEMORY_RETRIEVE_ASYNC_TEMPLATE,
+        _retrieve_values,
+        lambda values: "retrieve_memories.py",
+        lambda values: f"Run this script to retrieve memories from namespace '{values['namespace']}'"
+    ),
+    "delete": (
+        _MEMORY_DELETE_TEMPLATE,
+        None,
+        _delete_values,
+        lambda values: "delete_memory.py",
+        lambda values: "Run this script to delete the AgentCore Memory resource"
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _build(kind: str, items: Tuple, async_io: bool, emit_pyc: bool = False) -> Dict:
+    """Render the script for one handler kind from its (hashable) template values"""
+    template, async_template, _, filename_fn, instructions_fn = _HANDLERS[kind]
+    values = dict(items)
+    if async_io and async_template is not None:
+        template = async_template
+    
+    code = template.substitute(**_literals(values))
+    filename = filename_fn(values)
+    
+    # Compiling also catches values that break the generated script (e.g. a
+    # stray quote in a query) here rather than when the user runs it. It runs
+    # inside the cached build, so each distinct script is compiled only once.
+    code_object = compile(code, filename, "exec", dont_inherit=True)
+    
+    result = {
+        "code": code,
+        "filename": filename,
+        "instructions": instructions_fn(values)
+    }
+    if emit_pyc:
+        # Timestamp-based .pyc header (PEP 552 flags 0) with mtime and source
+        # size zeroed: there is no source file to validate against, so it is
+        # meant to be run directly ('python script.pyc'). Left in __pycache__
+        # next to a .py it would just be seen as stale and recompiled. Only
+        # loadable by the same Python minor version as this server.
+        pyc = importlib.util.MAGIC_NUMBER + bytes(12) + marshal.dumps(code_object)
+        result["code_pyc"] = base64.b64encode(pyc).decode("ascii")
+    return result
+
+
+async def _render(kind: str, args: Dict) -> Dict:
+    """Generate the script for a memory tool call"""
+    values = _HANDLERS[kind][2](args)
+    items = tuple(sorted(values.items()))
+    
+    # Hand out a copy so callers can't mutate the cached result
+    return dict(_build(kind, items, args.get("async_io", False), args.get("emit_pyc", False)))
+
+
+async def handle_memory_create(args: Dict) -> Dict:
+    """Generate script to create AgentCore Memory with strategies"""
+    return await _render("create", args)
+
+
+async def handle_memory_create_event(args: Dict) -> Dict:
+    """Generate script to store conversation messages in Memory"""
+    return await _render("create_event", args)
+
+
+async def handle_memory_retrieve(args: Dict) -> Dict:
+    """Generate script to retrieve memories from Memory"""
+    return await _render("retrieve", args)
+
+
+async def handle_memory_delete(args: Dict) -> Dict:
+    """Generate script to delete AgentCore Memory"""
+    return await _render("delete", args)
+
+
+# Pipeline script: one process and one pair of clients for several memory steps
+_PIPELINE_HEADER = ScriptTemplate('''#!/usr/bin/env python3
+"""
+Script to run several AgentCore Memory operations in one process.
+
+Steps: $ops
+"""
+
+import json
+import os
+import time
+
+try:
+    from bedrock_agentcore.memory import MemoryClient
+    from bedrock_agentcore_starter_toolkit.operations.memory.manager import MemoryManager
+except ImportError:
+    print("✗ Error: bedrock_agentcore packages not found")
+    print("  Install with: pip install bedrock-agentcore bedrock-agentcore-starter-toolkit")
+    exit(1)
+
+# Create the clients once and reuse them for every step
+memory_manager = MemoryManager(region_name=$region)
+memory_client = MemoryClient(region_name=$region)
+
+# Use the memory from a previous run unless a create step replaces it
+memory_id = None
+if os.path.exists('memory_config.json'):
+    with open('memory_config.json') as f:
+        memory_id = json.load(f)['memory_id']
+''')
+
+_PIPELINE_REQUIRE_MEMORY = '''
+if memory_id is None:
+    print("✗ Error: memory_config.json not found - add a create step or create the memory first")
+    exit(1)
 '''
+
+_PIPELINE_CREATE_STEP = ScriptTemplate('''
+# Step $step: create memory
+print("\\n[Step $step] Creating AgentCore Memory...")
+strategies = $strategies_json
+memory = memory_manager.get_or_create_memory(
+    name=$name,
+    description=$description,
+    strategies=strategies
+)
+memory_id = memory["id"]
+
+with open('memory_config.json', 'w') as f:
+    json.dump({"memory_id": memory_id, "name": $name, "region": $region}, f, indent=2)
+
+print(f"✓ Memory created successfully!")
+print(f"  Memory ID: {memory_id}")
+''')
+
+_PIPELINE_CREATE_EVENT_STEP = ScriptTemplate('''
+# Step $step: store messages
+print("\\n[Step $step] Storing messages in memory...")
+messages = $messages_json
+memory_client.create_event(
+    memory_id=memory_id,
+    actor_id=$actor_id,
+    session_id=$session_id,
+    messages=messages
+)
+print(f"✓ Stored {len(messages)} messages successfully!")
+''')
+
+_PIPELINE_WAIT_STEP = '''
+# Later steps read memories, so give extraction time to finish
+print("Waiting 30 seconds for memory processing...")
+time.sleep(30)
+'''
+
+_PIPELINE_RETRIEVE_STEP = ScriptTemplate('''
+# Step $step: retrieve memories
+namespace = $namespace
+print(f"\\n[Step $step] Retrieving memories from namespace: {namespace}")
+memories = memory_client.retrieve_memories(
+    memory_id=memory_id,
+    namespace=namespace,
+    query=$query,
+    top_k=$top_k
+)
+if memories:
+    print(f"✓ Retrieved {len(memories)} memories")
+    for i, memory in enumerate(memories, 1):
+        content = memory.get('content', {})
+        text = content.get('text', 'N/A') if isinstance(content, dict) else str(content)
+        print(f"  Memory {i}: {text}")
+else:
+    print("⚠️  No memories found (extraction may still be processing)")
+''')
+
+_PIPELINE_DELETE_STEP = ScriptTemplate('''
+# Step $step: delete memory
+print("\\n[Step $step] Deleting AgentCore Memory...")
+try:
+    memory_manager.delete_memory(memory_id=memory_id)
+    print("✓ Memory deleted successfully!")
+except Exception as e:
+    error_msg = str(e).lower()
+    if "not found" in error_msg or "does not exist" in error_msg or "resourcenotfound" in error_msg:
+        print("⚠️  Memory already deleted or not found")
+    else:
+        print(f"✗ Error deleting memory: {e}")
+        exit(1)
+''')
+
+# op -> (step template, values)
+_PIPELINE_STEPS = {
+    "create": (_PIPELINE_CREATE_STEP, _create_values),
+    "create_event": (_PIPELINE_CREATE_EVENT_STEP, _create_event_values),
+    "retrieve": (_PIPELINE_RETRIEVE_STEP, _retrieve_values),
+    "delete": (_PIPELINE_DELETE_STEP, _delete_values),
+}
+
+
+@lru_cache(maxsize=64)
+def _build_pipeline(region: str, steps_key: str) -> Dict:
+    """Render the pipeline script for a JSON-encoded list of steps"""
+    steps = json.loads(steps_key)
+    ops = [step.get("op") for step in steps]
+    unknown = [op for op in ops if op not in _PIPELINE_STEPS]
+    if unknown:
+        raise ValueError(f"Unknown memory pipeline op(s): {unknown}. "
+                         f"Expected one of: {', '.join(_PIPELINE_STEPS)}")
+    
+    parts = [_PIPELINE_HEADER.substitute(region=repr(region), ops=" -> ".join(ops))]
+    if ops and ops[0] != "create":
+        parts.append(_PIPELINE_REQUIRE_MEMORY)
+    for number, step in enumerate(steps, 1):
+        template, values_fn = _PIPELINE_STEPS[step["op"]]
+        values = values_fn({"region": region, **step})
+        parts.append(template.substitute(step=number, **_literals(values)))
+        # Wait once after storing messages if a later step retrieves them
+        if step["op"] == "create_event" and "retrieve" in ops[number:]:
+            parts.append(_PIPELINE_WAIT_STEP)
+    parts.append('\nprint("\\n✓ Memory pipeline completed successfully")\n')
+    code = "".join(parts)
+    # Validated once per distinct step list (this function is cached)
+    compile(code, "memory_pipeline.py", "exec", dont_inherit=True)
     
     return {
         "code": code,
-        "filename": "delete_memory.py",
-        "instructions": f"Run this script to delete the AgentCore Memory resource"
+        "filename": "memory_pipeline.py",
+        "instructions": f"Run this script to perform the memory steps in one process: {' -> '.join(ops)}"
     }
+
+
+async def handle_memory_pipeline(args: Dict) -> Dict:
+    """Generate one script that runs several memory operations in-process"""
+    
+    region = args.get("region", "us-west-2")
+    steps_key = json.dumps(args["steps"])
+    
+    # Hand out a copy so callers can't mutate the cached result
+    return dict(_build_pipeline(region, steps_key))
@@ -7,7 +7,10 @@ Implementation of Observability tool handlers for generating observability scrip
 from typing import Dict
 import json
 
+from ._memo import memoize_by_args
 
+
+@memoize_by_args()
 async def handle_observability_get_dashboard_url(args: Dict) -> Dict:
     """Generate script to get CloudWatch GenAI Observability dashboard URL"""
     
@@ -20,7 +23,7 @@ Script to get CloudWatch GenAI Observability dashboard URL.
 """
 
 # Build dashboard URL
-region = "{region}"
+region = {region!r}
 dashboard_url = f"https://console.aws.amazon.com/cloudwatch/home?region={{region}}#gen-ai-observability/agent-core"
 
 print("CloudWatch GenAI Observability Dashboard")
@@ -43,6 +46,7 @@ print("\\nOpen this URL in your browser to view the dashboard")
     }
 
 
+@memoize_by_args()
 async def handle_observability_get_logs_info(args: Dict) -> Dict:
     """Generate script to get CloudWatch log group information"""
     
@@ -82,7 +86,7 @@ print("=" * 80)
 print(f"\\nAgent ARN: {{agent_arn}}")
 print(f"Agent ID: {{agent_id}}")
 print(f"Log Group: {{log_group}}")
-print(f"Region: {region}")
+print("Region:", {region!r})
 print("\\nCLI Commands:")
 print(f"\\nTail logs (real-time):")
 print(f"  {{tail_command}}")
@@ -97,6 +101,7 @@ print(f"  {{recent_command}}")
     }
 
 
+@memoize_by_args()
 async def handle_observability_get_recent_logs(args: Dict) -> Dict:
     """Generate script to retrieve recent logs from CloudWatch"""
     
@@ -126,30 +131,35 @@ agent_id = agent_arn.split('/')[-1]
 log_group = f"/aws/bedrock-agentcore/runtimes/{{agent_id}}-DEFAULT"
 
 # Initialize CloudWatch Logs client
-logs_client = boto3.client('logs', region_name='{region}')
+logs_client = boto3.client('logs', region_name={region!r})
 
 # Calculate start time
 start_time = int((datetime.now() - timedelta(hours={hours_back})).timestamp() * 1000)
 
 try:
-    # Fetch log events
-    print(f"Retrieving logs from {{log_group}}...")
-    response = logs_client.filter_log_events(
+    # Fetch log events page by page (following nextToken), printing each
+    # event as it arrives instead of collecting them all first
+    print(f"Retrieving logs from {{log_group}}...\\n")
+    print("=" * 80)
+    
+    paginator = logs_client.get_paginator('filter_log_events')
+    pages = paginator.paginate(
         logGroupName=log_group,
-        limit={limit},
-        startTime=start_time
+        startTime=start_time,
+        PaginationConfig={{'MaxItems': {limit}}}
     )
     
-    events = response.get('events', [])
-    
-    print(f"\\n✓ Retrieved {{len(events)}} log events from the last {hours_back} hour(s)\\n")
-    print("=" * 80)
+    # Loop-invariant lookups bound once for the per-event loop
+    from_timestamp = datetime.fromtimestamp
+    separator = "-" * 80
+    event_count = 0
+    for page in pages:
+        for event in page.get('events', []):
+            timestamp = from_timestamp(event['timestamp'] / 1000).isoformat()
+            print(f"[{{timestamp}}] {{event['message']}}\\n{{separator}}")
+            event_count += 1
     
-    for event in events:
-        timestamp = datetime.fromtimestamp(event['timestamp'] / 1000).isoformat()
-        message = event['message']
-        print(f"[{{timestamp}}] {{message}}")
-        print("-" * 80)
+    print(f"\\n✓ Retrieved {{event_count}} log events from the last {hours_back} hour(s)")
         
 except logs_client.exceptions.ResourceNotFoundException:
     print(f"✗ Log group not found: {{log_group}}")
@@ -2,27 +2,100 @@
 AgentCore Runtime Handlers
 
 Implementation of Runtime tool handlers for generating runtime operation scripts.
+Handlers render from templates parsed at import and memoize per argument set;
+they stay coroutines and return code as str like every other handler (see the
+package docstring).
 """
 
-from typing import Dict
+from typing import Callable, Dict, Tuple
 import json
 
+from ._memo import memoize_by_args
+from ._snippets import load_config_or_exit, pretty_json
+from ._template import ScriptTemplate
+
+# Shared preamble for the rerunnable delete script
+_LOAD_RUNTIME_CONFIG_OR_EXIT = load_config_or_exit('runtime_config.json', 'runtime', 'runtime_config')
+
+# Argument defaults, merged under the caller's args in one step
+_CONFIGURE_DEFAULTS = {
+    "region": "us-west-2",
+    "auto_create_ecr": True,
+    "memory_mode": "NO_MEMORY",
+    "requirements_file": "requirements.txt"
+}
+_LAUNCH_DEFAULTS = {"region": "us-west-2", "auto_update_on_conflict": True}
+
+# Required configure arguments. execution_role and the Cognito values aren't
+# used by the template (the script reads them from the config files) but are
+# still part of the tool's contract.
+_CONFIGURE_REQUIRED = (
+    "entrypoint", "agent_name", "execution_role", "cognito_client_id", "cognito_discovery_url"
+)
 
-async def handle_runtime_configure(args: Dict) -> Dict:
-    """Generate script to configure AgentCore Runtime deployment settings"""
-    
-    region = args.get("region", "us-west-2")
-    entrypoint = args["entrypoint"]
-    agent_name = args["agent_name"]
-    execution_role = args["execution_role"]
-    cognito_client_id = args["cognito_client_id"]
-    cognito_discovery_url = args["cognito_discovery_url"]
-    auto_create_ecr = args.get("auto_create_ecr", True)
-    memory_mode = args.get("memory_mode", "NO_MEMORY")
-    requirements_file = args.get("requirements_file", "requirements.txt")
-    
-    # Generate Python script code
-    code = f'''#!/usr/bin/env python3
+# Static filename/instructions per script, merged into each result
+_CONFIGURE_META = {"filename": "configure_runtime.py", "instructions": "Run this script to configure AgentCore Runtime deployment settings"}
+_LAUNCH_META = {"filename": "launch_to_runtime.py", "instructions": "Run this script to deploy the agent to AgentCore Runtime"}
+_STATUS_META = {"filename": "check_runtime_status.py", "instructions": "Run this script to check the deployment status"}
+_INVOKE_META = {"filename": "invoke_agent.py", "instructions": "Run this script to invoke the deployed agent"}
+_DELETE_META = {"filename": "delete_runtime.py", "instructions": "Run this script to delete the AgentCore Runtime deployment"}
+
+# Payload used by the invoke script when the caller doesn't pass one
+_DEFAULT_PAYLOAD_JSON = pretty_json({"actor_id": "user_001", "prompt": "What do you know about me?"})
+
+# Fragments shared by the scripts that act on an already configured agent.
+# They are joined into the templates below before parsing, so they may use
+# the same $placeholders. Placeholders take Python literals: handlers pass
+# repr() of caller-supplied values, so quotes or backslashes in them can't
+# break the generated source.
+_LOAD_AGENT_YAML = '''# Load .bedrock_agentcore.yaml to get agent name and entrypoint
+if not os.path.exists('.bedrock_agentcore.yaml'):
+    print("❌ Error: .bedrock_agentcore.yaml not found")
+    print("Please run configure_runtime.py first")
+    exit(1)
+
+import yaml
+with open('.bedrock_agentcore.yaml') as f:
+    runtime_config = yaml.safe_load(f)
+
+default_agent = runtime_config.get('default_agent')
+agent_config = runtime_config.get('agents', {}).get(default_agent, {})
+agent_name = agent_config.get('name')
+entrypoint = agent_config.get('entrypoint')
+'''
+
+# Shared by all four scripts that call runtime.configure(); each binds
+# cognito_config first. Has no placeholders (the authorizer reads
+# cognito_config at run time), so it is static text in every template and
+# costs nothing per call
+_RUNTIME_AUTH_CONFIG = '''# Initialize Runtime
+runtime = Runtime()
+
+# Build authorizer configuration for Cognito JWT
+auth_config = {
+    "customJWTAuthorizer": {
+        "allowedClients": [cognito_config["client_id"]],
+        "discoveryUrl": cognito_config["discovery_url"]
+    }
+}
+'''
+
+_CONFIGURE_RUNTIME = '''runtime.configure(
+    entrypoint=entrypoint,
+    agent_name=agent_name,
+    execution_role=role_config["role_arn"],
+    auto_create_ecr=True,
+    memory_mode="NO_MEMORY",
+    requirements_file="requirements.txt",
+    region=$region,
+    authorizer_configuration=auth_config
+)
+'''
+
+# Script templates are parsed once at import; handlers only substitute values.
+# Headers stay inline: each script's docstring and import list differ, so a
+# shared header would only cover the shebang line.
+_RUNTIME_CONFIGURE_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
 """
 Script to configure AgentCore Runtime deployment.
 """
@@ -36,54 +109,31 @@ with open('runtime_execution_role_config.json') as f:
 with open('cognito_config.json') as f:
     cognito_config = json.load(f)
 
-# Initialize Runtime
-runtime = Runtime()
-
-# Build authorizer configuration for Cognito JWT
-auth_config = {{
-    "customJWTAuthorizer": {{
-        "allowedClients": [cognito_config["client_id"]],
-        "discoveryUrl": cognito_config["discovery_url"]
-    }}
-}}
-
+''' + _RUNTIME_AUTH_CONFIG + '''
 # Configure runtime deployment
 print("Configuring AgentCore Runtime...")
 response = runtime.configure(
-    entrypoint="{entrypoint}",
-    agent_name="{agent_name}",
+    entrypoint=$entrypoint,
+    agent_name=$agent_name,
     execution_role=role_config["role_arn"],
-    auto_create_ecr={auto_create_ecr},
-    memory_mode="{memory_mode}",
-    requirements_file="{requirements_file}",
-    region="{region}",
+    auto_create_ecr=$auto_create_ecr,
+    memory_mode=$memory_mode,
+    requirements_file=$requirements_file,
+    region=$region,
     authorizer_configuration=auth_config
 )
 
 print("✓ Runtime configured successfully!")
 print("  Configuration saved to .bedrock_agentcore.yaml")
 print("  Next step: Run launch script to deploy the agent")
-'''
-    
-    return {
-        "code": code,
-        "filename": "configure_runtime.py",
-        "instructions": "Run this script to configure AgentCore Runtime deployment settings"
-    }
+''')
 
+# Configure template specialized for the default arguments
+_DEFAULT_CONFIGURE_TEMPLATE = _RUNTIME_CONFIGURE_TEMPLATE.partial(
+    **{key: repr(value) for key, value in _CONFIGURE_DEFAULTS.items()}
+)
 
-async def handle_runtime_launch(args: Dict) -> Dict:
-    """Generate script to deploy agent to AgentCore Runtime"""
-    
-    region = args.get("region", "us-west-2")
-    env_vars = args["env_vars"]
-    auto_update_on_conflict = args.get("auto_update_on_conflict", True)
-    
-    # Build env_vars dict from args
-    env_vars_dict = env_vars
-    
-    # Generate Python script code
-    code = f'''#!/usr/bin/env python3
+_RUNTIME_LAUNCH_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
 """
 Script to launch agent to AgentCore Runtime.
 
@@ -96,7 +146,7 @@ import os
 from bedrock_agentcore_starter_toolkit import Runtime
 
 # Load configuration files that exist
-config_files = {{}}
+config_files = {}
 
 if os.path.exists('memory_config.json'):
     with open('memory_config.json') as f:
@@ -120,32 +170,10 @@ else:
     print("❌ Error: runtime_execution_role_config.json not found")
     exit(1)
 
-# Load .bedrock_agentcore.yaml to get agent name and entrypoint
-if not os.path.exists('.bedrock_agentcore.yaml'):
-    print("❌ Error: .bedrock_agentcore.yaml not found")
-    print("Please run configure_runtime.py first")
-    exit(1)
-
-import yaml
-with open('.bedrock_agentcore.yaml') as f:
-    runtime_config = yaml.safe_load(f)
-
-default_agent = runtime_config.get('default_agent')
-agent_config = runtime_config.get('agents', {{}}).get(default_agent, {{}})
-agent_name = agent_config.get('name')
-entrypoint = agent_config.get('entrypoint')
-
-# Initialize Runtime
-runtime = Runtime()
-
-# Build authorizer configuration for Cognito JWT
-auth_config = {{
-    "customJWTAuthorizer": {{
-        "allowedClients": [config_files['cognito']["client_id"]],
-        "discoveryUrl": config_files['cognito']["discovery_url"]
-    }}
-}}
+''' + _LOAD_AGENT_YAML + '''
+cognito_config = config_files['cognito']
 
+''' + _RUNTIME_AUTH_CONFIG + '''
 # Configure runtime (loads existing config or creates new one)
 print("Configuring runtime...")
 runtime.configure(
@@ -155,16 +183,16 @@ runtime.configure(
     auto_create_ecr=True,
     memory_mode="NO_MEMORY",
     requirements_file="requirements.txt",
-    region="{region}",
+    region=$region,
     authorizer_configuration=auth_config
 )
 print("✓ Runtime configured")
 
 # Build environment variables from config files
-env_vars = {{}}
+env_vars = {}
 
 # Add environment variables passed from MCP tool
-env_vars.update({json.dumps(env_vars_dict)})
+env_vars.update($env_vars_json)
 
 # Add memory ID if available
 if 'memory' in config_files:
@@ -183,9 +211,9 @@ env_vars["OAUTH_SCOPES"] = " ".join(config_files['cognito'].get("scopes", ["agen
 print("\\nEnvironment variables:")
 for key in env_vars:
     if "SECRET" in key or "PASSWORD" in key:
-        print(f"  {{key}}: ***")
+        print(f"  {key}: ***")
     else:
-        print(f"  {{key}}: {{env_vars[key]}}")
+        print(f"  {key}: {env_vars[key]}")
 
 # Launch agent
 print("\\n" + "=" * 80)
@@ -202,17 +230,17 @@ print("=" * 80)
 
 launch_result = runtime.launch(
     env_vars=env_vars,
-    auto_update_on_conflict={auto_update_on_conflict}
+    auto_update_on_conflict=$auto_update_on_conflict
 )
 
 agent_arn = launch_result.agent_arn
 
 # Save agent ARN to config
-runtime_output_config = {{
+runtime_output_config = {
     "agent_arn": agent_arn,
     "agent_name": agent_name,
-    "region": "{region}"
-}}
+    "region": $region
+}
 
 # Add memory_id if available
 if 'memory' in config_files:
@@ -226,7 +254,7 @@ with open('runtime_config.json', 'w') as f:
     json.dump(runtime_output_config, f, indent=2)
 
 print(f"\\n✓ Agent deployment initiated!")
-print(f"  Agent ARN: {{agent_arn}}")
+print(f"  Agent ARN: {agent_arn}")
 print(f"✓ Configuration saved to runtime_config.json")
 print("\\n" + "=" * 80)
 print("NEXT STEPS")
@@ -237,22 +265,9 @@ print("\\n2. Wait for status to show 'READY' (may take a few more minutes)")
 print("\\n3. Once READY, test your agent:")
 print("   Run: python invoke_agent.py")
 print("\\n" + "=" * 80)
-'''
-    
-    return {
-        "code": code,
-        "filename": "launch_to_runtime.py",
-        "instructions": "Run this script to deploy the agent to AgentCore Runtime"
-    }
-
+''')
 
-async def handle_runtime_status(args: Dict) -> Dict:
-    """Generate script to check AgentCore Runtime deployment status"""
-    
-    region = args.get("region", "us-west-2")
-    
-    # Generate Python script code
-    code = f'''#!/usr/bin/env python3
+_RUNTIME_STATUS_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
 """
 Script to check AgentCore Runtime deployment status.
 """
@@ -273,53 +288,19 @@ with open('runtime_execution_role_config.json') as f:
 with open('cognito_config.json') as f:
     cognito_config = json.load(f)
 
-# Load .bedrock_agentcore.yaml to get agent name and entrypoint
-if not os.path.exists('.bedrock_agentcore.yaml'):
-    print("❌ Error: .bedrock_agentcore.yaml not found")
-    print("Please run configure_runtime.py first")
-    exit(1)
-
-import yaml
-with open('.bedrock_agentcore.yaml') as f:
-    runtime_config = yaml.safe_load(f)
-
-default_agent = runtime_config.get('default_agent')
-agent_config = runtime_config.get('agents', {{}}).get(default_agent, {{}})
-agent_name = agent_config.get('name')
-entrypoint = agent_config.get('entrypoint')
-
-# Initialize Runtime
-runtime = Runtime()
-
-# Build authorizer configuration for Cognito JWT
-auth_config = {{
-    "customJWTAuthorizer": {{
-        "allowedClients": [cognito_config["client_id"]],
-        "discoveryUrl": cognito_config["discovery_url"]
-    }}
-}}
-
+''' + _LOAD_AGENT_YAML + '''
+''' + _RUNTIME_AUTH_CONFIG + '''
 # Configure runtime (to load existing configuration)
 print("Loading runtime configuration...")
-runtime.configure(
-    entrypoint=entrypoint,
-    agent_name=agent_name,
-    execution_role=role_config["role_arn"],
-    auto_create_ecr=True,
-    memory_mode="NO_MEMORY",
-    requirements_file="requirements.txt",
-    region="{region}",
-    authorizer_configuration=auth_config
-)
-
+''' + _CONFIGURE_RUNTIME + '''
 # Check status
 print("Checking runtime deployment status...")
 status_response = runtime.status()
 
 status = status_response.endpoint["status"]
 
-print(f"\\nAgent Status: {{status}}")
-print(f"Endpoint Details: {{json.dumps(status_response.endpoint, indent=2, default=str)}}")
+print(f"\\nAgent Status: {status}")
+print(f"Endpoint Details: {json.dumps(status_response.endpoint, indent=2, default=str)}")
 
 if status == "READY":
     print("\\n" + "=" * 80)
@@ -338,26 +319,12 @@ elif status in ["CREATE_FAILED", "UPDATE_FAILED"]:
     print("✗ Agent deployment failed!")
     print("=" * 80)
     print("\\nCheck CloudWatch logs for details:")
-    print(f"  Log group: /aws/bedrock-agentcore/runtime/{{agent_name}}")
+    print(f"  Log group: /aws/bedrock-agentcore/runtime/{agent_name}")
 else:
-    print(f"\\n⚠ Unknown status: {{status}}")
-'''
-    
-    return {
-        "code": code,
-        "filename": "check_runtime_status.py",
-        "instructions": "Run this script to check the deployment status"
-    }
-
+    print(f"\\n⚠ Unknown status: {status}")
+''')
 
-async def handle_runtime_invoke(args: Dict) -> Dict:
-    """Generate script to invoke a deployed AgentCore Runtime agent"""
-    
-    region = args.get("region", "us-west-2")
-    payload = args.get("payload", {"actor_id": "user_001", "prompt": "What do you know about me?"})
-    
-    # Generate Python script code
-    code = f'''#!/usr/bin/env python3
+_RUNTIME_INVOKE_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
 """
 Script to invoke deployed AgentCore Runtime agent.
 """
@@ -365,7 +332,9 @@ Script to invoke deployed AgentCore Runtime agent.
 import json
 import base64
 import os
-import requests
+import urllib.error
+import urllib.parse
+import urllib.request
 from bedrock_agentcore_starter_toolkit import Runtime
 
 # Check if runtime config exists
@@ -380,21 +349,7 @@ with open('cognito_config.json') as f:
 with open('runtime_execution_role_config.json') as f:
     role_config = json.load(f)
 
-# Load .bedrock_agentcore.yaml to get agent name and entrypoint
-if not os.path.exists('.bedrock_agentcore.yaml'):
-    print("❌ Error: .bedrock_agentcore.yaml not found")
-    print("Please run configure_runtime.py first")
-    exit(1)
-
-import yaml
-with open('.bedrock_agentcore.yaml') as f:
-    runtime_config = yaml.safe_load(f)
-
-default_agent = runtime_config.get('default_agent')
-agent_config = runtime_config.get('agents', {{}}).get(default_agent, {{}})
-agent_name = agent_config.get('name')
-entrypoint = agent_config.get('entrypoint')
-
+''' + _LOAD_AGENT_YAML + '''
 # Generate bearer token using Cognito client credentials flow
 print("Generating OAuth bearer token...")
 
@@ -403,62 +358,44 @@ domain = cognito_config["domain"].split('.')[0]  # Get domain prefix
 region = cognito_config["region"]
 
 # Construct token endpoint
-token_endpoint = f"https://{{domain}}.auth.{{region}}.amazoncognito.com/oauth2/token"
+token_endpoint = f"https://{domain}.auth.{region}.amazoncognito.com/oauth2/token"
 
-# Prepare credentials for Basic Auth
-credentials = f"{{cognito_config['client_id']}}:{{cognito_config['client_secret']}}"
+# Prepare credentials for Basic Auth (encoded here, from cognito_config.json,
+# so the client secret is never written into this script)
+credentials = f"{cognito_config['client_id']}:{cognito_config['client_secret']}"
 encoded_credentials = base64.b64encode(credentials.encode()).decode()
 
 # Get OAuth scopes
 oauth_scopes = " ".join(cognito_config.get("scopes", ["agentcore-gateway/read", "agentcore-gateway/write"]))
 
-# Request token
-response = requests.post(
+# Request token (a single form POST, so the standard library is enough)
+token_request = urllib.request.Request(
     token_endpoint,
-    headers={{
-        "Authorization": f"Basic {{encoded_credentials}}",
-        "Content-Type": "application/x-www-form-urlencoded"
-    }},
-    data={{
+    data=urllib.parse.urlencode({
         "grant_type": "client_credentials",
         "scope": oauth_scopes
-    }}
+    }).encode(),
+    headers={
+        "Authorization": f"Basic {encoded_credentials}",
+        "Content-Type": "application/x-www-form-urlencoded"
+    }
 )
 
-if response.status_code != 200:
-    print(f"❌ Failed to get OAuth token: {{response.text}}")
+try:
+    with urllib.request.urlopen(token_request) as token_response:
+        bearer_token = json.loads(token_response.read())["access_token"]
+except urllib.error.HTTPError as e:
+    print(f"❌ Failed to get OAuth token: {e.read().decode()}")
     exit(1)
-
-bearer_token = response.json()["access_token"]
 print("✓ OAuth token obtained")
 
-# Initialize Runtime
-runtime = Runtime()
-
-# Build authorizer configuration for Cognito JWT
-auth_config = {{
-    "customJWTAuthorizer": {{
-        "allowedClients": [cognito_config["client_id"]],
-        "discoveryUrl": cognito_config["discovery_url"]
-    }}
-}}
-
+''' + _RUNTIME_AUTH_CONFIG + '''
 # Configure runtime (to load existing configuration)
 print("\\nConfiguring runtime...")
-runtime.configure(
-    entrypoint=entrypoint,
-    agent_name=agent_name,
-    execution_role=role_config["role_arn"],
-    auto_create_ecr=True,
-    memory_mode="NO_MEMORY",
-    requirements_file="requirements.txt",
-    region="{region}",
-    authorizer_configuration=auth_config
-)
-
+''' + _CONFIGURE_RUNTIME + '''
 # Invoke agent
 print("\\nInvoking agent...")
-payload = {json.dumps(payload, indent=4)}
+payload = $payload_json
 
 try:
     response = runtime.invoke(
@@ -475,29 +412,20 @@ except Exception as e:
     print(f"\\n" + "=" * 80)
     print(f"❌ Error invoking agent")
     print("=" * 80)
-    print(f"Error: {{e}}")
+    print(f"Error: {e}")
     print("\\nTroubleshooting:")
     print("  1. Check agent status: python check_runtime_status.py")
     print("  2. Verify agent is in READY state")
     print("  3. Check CloudWatch logs for errors")
     print("=" * 80)
     exit(1)
-'''
-    
-    return {
-        "code": code,
-        "filename": "invoke_agent.py",
-        "instructions": "Run this script to invoke the deployed agent"
-    }
-
+''')
 
-async def handle_runtime_delete(args: Dict) -> Dict:
-    """Generate script to delete an AgentCore Runtime agent deployment"""
-    
-    region = args.get("region", "us-west-2")
-    
-    # Generate Python script code using boto3 (like reference notebook)
-    code = f'''#!/usr/bin/env python3
+# The delete script makes a single API call through one boto3 client. boto3's
+# default session is a thin wrapper created once per process, and credential
+# and endpoint resolution happen in botocore either way, so the script stays
+# on boto3.client() like the other generated scripts.
+_RUNTIME_DELETE_TEMPLATE = ScriptTemplate('''#!/usr/bin/env python3
 """
 Script to delete AgentCore Runtime agent deployment.
 
@@ -511,21 +439,7 @@ import boto3
 
 print("Deleting AgentCore Runtime...")
 
-# Check if runtime config exists
-if not os.path.exists('runtime_config.json'):
-    print("⚠️  Runtime config not found - nothing to delete")
-    print("✓ Script completed successfully (no resources to delete)")
-    exit(0)
-
-# Load runtime configuration
-try:
-    with open('runtime_config.json') as f:
-        runtime_config = json.load(f)
-except Exception as e:
-    print(f"⚠️  Failed to load runtime config: {{e}}")
-    print("✓ Script completed successfully (no resources to delete)")
-    exit(0)
-
+''' + _LOAD_RUNTIME_CONFIG_OR_EXIT + '''
 agent_arn = runtime_config.get('agent_arn')
 
 if not agent_arn:
@@ -536,11 +450,11 @@ if not agent_arn:
 # Extract agent ID from ARN
 agent_id = agent_arn.split('/')[-1]
 
-print(f"  Agent ID: {{agent_id}}")
+print(f"  Agent ID: {agent_id}")
 
 # Delete the agent using boto3 (like reference notebook)
 try:
-    agentcore_client = boto3.client('bedrock-agentcore-control', region_name='{region}')
+    agentcore_client = boto3.client('bedrock-agentcore-control', region_name=$region)
     agentcore_client.delete_agent_runtime(agentRuntimeId=agent_id)
     print("✓ Agent runtime deleted successfully!")
 except Exception as e:
@@ -549,15 +463,120 @@ except Exception as e:
         print("⚠️  Agent already deleted or not found")
         print("✓ Script completed successfully (resource already removed)")
     else:
-        print(f"✗ Error deleting agent: {{e}}")
+        print(f"✗ Error deleting agent: {e}")
         exit(1)
 
 print("\\n✓ Runtime deletion completed successfully")
 print("✓ This script is RERUNNABLE - you can safely run it multiple times.")
-'''
+''')
+
+
+def _configure_values(args: Dict) -> Tuple[ScriptTemplate, Dict]:
+    """Template and values for the configure script"""
+    
+    # One merge with the defaults instead of a lookup per argument. The
+    # template placeholders share the argument names, so the merged dict is
+    # substituted directly; the required-argument check runs first.
+    values = {**_CONFIGURE_DEFAULTS, **args}
+    missing = [key for key in _CONFIGURE_REQUIRED if key not in values]
+    if missing:
+        raise ValueError(f"Missing required configure argument(s): {', '.join(missing)}")
+    
+    # Most calls keep every default, so use the copy of the template that
+    # has them baked in and only join entrypoint and agent_name
+    if all(type(values[key]) is type(default) and values[key] == default
+           for key, default in _CONFIGURE_DEFAULTS.items()):
+        template = _DEFAULT_CONFIGURE_TEMPLATE
+    else:
+        template = _RUNTIME_CONFIGURE_TEMPLATE
+    
+    return template, {key: repr(value) for key, value in values.items()}
+
+
+def _launch_values(args: Dict) -> Tuple[ScriptTemplate, Dict]:
+    """Template and values for the launch script"""
+    
+    values = {**_LAUNCH_DEFAULTS, **args}
+    
+    # Serialize env_vars once, compactly; the script only embeds the literal
+    env_vars_json = json.dumps(values["env_vars"], separators=(",", ":"))
+    
+    return _RUNTIME_LAUNCH_TEMPLATE, {
+        "region": repr(values["region"]),
+        "env_vars_json": env_vars_json,
+        "auto_update_on_conflict": values["auto_update_on_conflict"]
+    }
+
+
+def _status_values(args: Dict) -> Tuple[ScriptTemplate, Dict]:
+    """Template and values for the status script"""
+    return _RUNTIME_STATUS_TEMPLATE, {"region": repr(args.get("region", "us-west-2"))}
+
+
+def _invoke_values(args: Dict) -> Tuple[ScriptTemplate, Dict]:
+    """Template and values for the invoke script"""
+    
+    # The payload stays indented since users edit it in the generated script;
+    # pretty_json indents via orjson when it's installed, avoiding the
+    # pure-Python path json.dumps takes whenever indent is set
+    if "payload" in args:
+        payload_json = pretty_json(args["payload"])
+    else:
+        payload_json = _DEFAULT_PAYLOAD_JSON
     
-    return {
-        "code": code,
-        "filename": "delete_runtime.py",
-        "instructions": "Run this script to delete the AgentCore Runtime deployment"
+    return _RUNTIME_INVOKE_TEMPLATE, {
+        "region": repr(args.get("region", "us-west-2")),
+        "payload_json": payload_json
     }
+
+
+def _delete_values(args: Dict) -> Tuple[ScriptTemplate, Dict]:
+    """Template and values for the delete script (boto3, like reference notebook)"""
+    return _RUNTIME_DELETE_TEMPLATE, {"region": repr(args.get("region", "us-west-2"))}
+
+
+# Handler kind -> (template/values builder, static filename and instructions)
+_HANDLERS: Dict[str, Tuple[Callable[[Dict], Tuple[ScriptTemplate, Dict]], Dict]] = {
+    "configure": (_configure_values, _CONFIGURE_META),
+    "launch": (_launch_values, _LAUNCH_META),
+    "status": (_status_values, _STATUS_META),
+    "invoke": (_invoke_values, _INVOKE_META),
+    "delete": (_delete_values, _DELETE_META),
+}
+
+
+async def _render(kind: str, args: Dict) -> Dict:
+    """Generate the script for a runtime tool call"""
+    values_fn, meta = _HANDLERS[kind]
+    template, values = values_fn(args)
+    return {"code": template.substitute(**values), **meta}
+
+
+@memoize_by_args()
+async def handle_runtime_configure(args: Dict) -> Dict:
+    """Generate script to configure AgentCore Runtime deployment settings"""
+    return await _render("configure", args)
+
+
+@memoize_by_args()
+async def handle_runtime_launch(args: Dict) -> Dict:
+    """Generate script to deploy agent to AgentCore Runtime"""
+    return await _render("launch", args)
+
+
+@memoize_by_args()
+async def handle_runtime_status(args: Dict) -> Dict:
+    """Generate script to check AgentCore Runtime deployment status"""
+    return await _render("status", args)
+
+
+@memoize_by_args()
+async def handle_runtime_invoke(args: Dict) -> Dict:
+    """Generate script to invoke a deployed AgentCore Runtime agent"""
+    return await _render("invoke", args)
+
+
+@memoize_by_args()
+async def handle_runtime_delete(args: Dict) -> Dict:
+    """Generate script to delete an AgentCore Runtime agent deployment"""
+    return await _render("delete", args)
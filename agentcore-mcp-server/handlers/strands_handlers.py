@@ -5,9 +5,15 @@ Implementation of handlers for generating Strands agent code with various
 configurations and integrations.
 """
 
+from copy import deepcopy
 from typing import Dict
 
+from ._memo import memoize_by_args
 
+
+# Results nest dicts and lists (integrations, required_env_vars), so callers get
+# a deep copy and can't mutate the cached result
+@memoize_by_args(maxsize=128, copy=deepcopy)
 async def handle_generate_strands_agent(args: Dict) -> Dict:
     """Generate standalone Strands Agent Python code"""
     
@@ -355,6 +361,7 @@ if __name__ == "__main__":
     }
 
 
+@memoize_by_args(maxsize=128, copy=deepcopy)
 async def handle_generate_agentcore_runtime_agent(args: Dict) -> Dict:
     """Generate AgentCore Runtime-ready Strands Agent with BedrockAgentCoreApp entrypoint"""
     
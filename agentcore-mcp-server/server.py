@@ -34,42 +34,12 @@ For detailed examples, see: https://github.com/awslabs/mcp-aws-bedrock-agentcore
 from typing import Optional
 from fastmcp import FastMCP
 
-# Import handlers
-from handlers import (
-    # Identity handlers
-    handle_create_runtime_execution_role_script,
-    
-    # Memory handlers
-    handle_memory_create,
-    handle_memory_create_event,
-    handle_memory_retrieve,
-    handle_memory_delete,
-
-    # Gateway handlers
-    handle_gateway_create,
-    handle_gateway_add_lambda_target,
-    handle_gateway_list_targets,
-    handle_gateway_delete_target,
-    handle_gateway_delete,
-    
-    # Runtime handlers
-    handle_runtime_configure,
-    handle_runtime_launch,
-    handle_runtime_status,
-    handle_runtime_invoke,
-    handle_runtime_delete,
-    
-    # Observability handlers
-    handle_observability_get_dashboard_url,
-    handle_observability_get_logs_info,
-    handle_observability_get_recent_logs,
-    
-    # Strands handlers
-    handle_generate_strands_agent,
-    handle_generate_agentcore_runtime_agent,
-)
+# Handlers are imported inside each tool so only the ones used get loaded
 
 # Initialize FastMCP server
+# Tools keep plain typed parameters: FastMCP derives each tool's input schema
+# (what MCP clients see) from these signatures, so they shouldn't be collapsed
+# into a single pre-encoded argument blob.
 mcp = FastMCP("aws-bedrock-agentcore")
 
 
@@ -98,19 +68,26 @@ async def agentcore_create_runtime_execution_role_script(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_create_runtime_execution_role_script
     return await handle_create_runtime_execution_role_script({"region": region})
 
 
 # ============================================================================
 # MEMORY TOOLS
 # ============================================================================
+# Only the memory tools take emit_pyc: their handlers already compile each
+# script to validate the substituted values (queries, descriptions, message
+# payloads), so the bytecode comes at no extra cost. The other tools' scripts
+# are run once per setup step, where a .pyc saves nothing worth the
+# Python-version coupling.
 
 @mcp.tool()
 async def agentcore_memory_create(
     name: str,
     strategies: list[dict],
     description: str = "",
-    region: str = "us-west-2"
+    region: str = "us-west-2",
+    emit_pyc: bool = False
 ) -> dict:
     """Create an AgentCore Memory resource with memory strategies.
     
@@ -130,25 +107,29 @@ async def agentcore_memory_create(
             - semanticMemoryStrategy: {'name': 'semantic', 'namespaces': ['app/{actorId}/semantic']}
         description: Human-readable description of the memory's purpose
         region: AWS region (default: us-west-2)
+        emit_pyc: Also return the script precompiled as base64 .pyc (code_pyc)
     
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_memory_create
     return await handle_memory_create({
         "name": name,
         "strategies": strategies,
         "description": description,
-        "region": region
+        "region": region,
+        "emit_pyc": emit_pyc
     })
 
 
 @mcp.tool()
 async def agentcore_memory_create_event(
-    memory_id: str,
     actor_id: str,
     session_id: str,
     messages: list[tuple[str, str]],
-    region: str = "us-west-2"
+    region: str = "us-west-2",
+    async_io: bool = False,
+    emit_pyc: bool = False
 ) -> dict:
     """Store conversation messages in AgentCore Memory.
     
@@ -158,33 +139,44 @@ async def agentcore_memory_create_event(
     - Facts embedded → SEMANTIC namespace
     - Summaries generated → SUMMARY namespace
     
+    The generated script reads the memory ID from memory_config.json
+    (written by the agentcore_memory_create script).
+    
+    For several memory operations in a row, agentcore_memory_pipeline
+    generates one script that shares the clients (and boto3 start-up cost)
+    across all steps.
+    
     Args:
-        memory_id: Memory ID from agentcore_memory_create (e.g., 'my_memory-ABC123')
         actor_id: Unique identifier for the user (e.g., 'user_001')
         session_id: Unique identifier for the session (e.g., 'session_20240116')
         messages: List of (message, role) tuples where role is 'USER' or 'ASSISTANT'
         region: AWS region (default: us-west-2)
+        async_io: Generate a non-blocking aioboto3 script (default: False)
+        emit_pyc: Also return the script precompiled as base64 .pyc (code_pyc)
     
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_memory_create_event
     return await handle_memory_create_event({
-        "memory_id": memory_id,
         "actor_id": actor_id,
         "session_id": session_id,
         "messages": messages,
-        "region": region
+        "region": region,
+        "async_io": async_io,
+        "emit_pyc": emit_pyc
     })
 
 
 @mcp.tool()
 async def agentcore_memory_retrieve(
-    memory_id: str,
     namespace: str,
     query: str,
     top_k: int = 3,
     relevance_score: float = 0.2,
-    region: str = "us-west-2"
+    region: str = "us-west-2",
+    async_io: bool = False,
+    emit_pyc: bool = False
 ) -> dict:
     """Retrieve memories using semantic search.
     
@@ -198,46 +190,90 @@ async def agentcore_memory_retrieve(
     
     Use actual values (e.g., 'app/user_001/preferences') not placeholders.
     
+    The generated script reads the memory ID from memory_config.json.
+    
+    For several memory operations in a row, agentcore_memory_pipeline
+    generates one script that shares the clients (and boto3 start-up cost)
+    across all steps.
+    
     Args:
-        memory_id: Memory ID to query (e.g., 'my_memory-ABC123')
         namespace: Namespace pattern with actual values (e.g., 'app/user_001/preferences')
         query: Natural language search query (e.g., 'user preferences and settings')
         top_k: Maximum number of results to return (default: 3)
         relevance_score: Minimum similarity threshold 0.0-1.0 (default: 0.2)
         region: AWS region (default: us-west-2)
+        async_io: Generate a non-blocking aioboto3 script (default: False)
+        emit_pyc: Also return the script precompiled as base64 .pyc (code_pyc)
     
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_memory_retrieve
     return await handle_memory_retrieve({
-        "memory_id": memory_id,
         "namespace": namespace,
         "query": query,
         "top_k": top_k,
         "relevance_score": relevance_score,
-        "region": region
+        "region": region,
+        "async_io": async_io,
+        "emit_pyc": emit_pyc
     })
 
 
 @mcp.tool()
 async def agentcore_memory_delete(
-    memory_id: str,
-    region: str = "us-west-2"
+    region: str = "us-west-2",
+    emit_pyc: bool = False
 ) -> dict:
     """Delete an AgentCore Memory resource and all associated data.
     
     WARNING: This permanently deletes the memory and all stored conversations,
     preferences, and summaries. This action cannot be undone.
     
+    The generated script deletes the memory recorded in memory_config.json.
+    
     Args:
-        memory_id: Memory ID to delete (e.g., 'my_memory-ABC123')
         region: AWS region (default: us-west-2)
+        emit_pyc: Also return the script precompiled as base64 .pyc (code_pyc)
     
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_memory_delete
     return await handle_memory_delete({
-        "memory_id": memory_id,
+        "region": region,
+        "emit_pyc": emit_pyc
+    })
+
+
+@mcp.tool()
+async def agentcore_memory_pipeline(
+    steps: list[dict],
+    region: str = "us-west-2"
+) -> dict:
+    """Generate one script that runs several memory operations in a single process.
+    
+    Instead of one script per operation (each paying its own imports, client
+    setup and config reads), the pipeline script creates the memory clients
+    once and runs the steps in order. If a store step is followed by a
+    retrieve step, the script waits for memory extraction in between.
+    
+    Each step is a dict with an 'op' and that operation's arguments:
+    - {'op': 'create', 'name': ..., 'strategies': [...], 'description': ...}
+    - {'op': 'create_event', 'actor_id': ..., 'session_id': ..., 'messages': [...]}
+    - {'op': 'retrieve', 'namespace': ..., 'query': ..., 'top_k': 3}
+    - {'op': 'delete'}
+    
+    Args:
+        steps: Ordered list of memory operations (see above)
+        region: AWS region (default: us-west-2)
+    
+    Returns:
+        dict: Generated script with code, filename, and instructions
+    """
+    from handlers import handle_memory_pipeline
+    return await handle_memory_pipeline({
+        "steps": steps,
         "region": region
     })
 
@@ -276,6 +312,7 @@ async def agentcore_gateway_create(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_gateway_create
     return await handle_gateway_create({
         "name": name,
         "role_arn": role_arn,
@@ -316,6 +353,7 @@ async def agentcore_gateway_add_lambda_target(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_gateway_add_lambda_target
     return await handle_gateway_add_lambda_target({
         "gateway_id": gateway_id,
         "target_name": target_name,
@@ -343,6 +381,7 @@ async def agentcore_gateway_list_targets(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_gateway_list_targets
     return await handle_gateway_list_targets({
         "gateway_id": gateway_id,
         "region": region
@@ -368,6 +407,7 @@ async def agentcore_gateway_delete_target(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_gateway_delete_target
     return await handle_gateway_delete_target({
         "gateway_id": gateway_id,
         "target_id": target_id,
@@ -392,6 +432,7 @@ async def agentcore_gateway_delete(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_gateway_delete
     return await handle_gateway_delete({
         "gateway_id": gateway_id,
         "region": region
@@ -433,6 +474,7 @@ async def agentcore_runtime_configure(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_runtime_configure
     return await handle_runtime_configure({
         "entrypoint": entrypoint,
         "agent_name": agent_name,
@@ -466,6 +508,7 @@ async def agentcore_runtime_launch(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_runtime_launch
     return await handle_runtime_launch({
         "env_vars": env_vars,
         "auto_update_on_conflict": auto_update_on_conflict,
@@ -488,6 +531,7 @@ async def agentcore_runtime_status(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_runtime_status
     return await handle_runtime_status({"region": region})
 
 
@@ -509,6 +553,7 @@ async def agentcore_runtime_invoke(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_runtime_invoke
     return await handle_runtime_invoke({
         "payload": payload,
         "bearer_token": bearer_token,
@@ -531,6 +576,7 @@ async def agentcore_runtime_delete(
     Returns:
         dict: Generated script with code, filename, and instructions
     """
+    from handlers import handle_runtime_delete
     return await handle_runtime_delete({"region": region})
 
 
@@ -555,6 +601,7 @@ async def agentcore_observability_get_dashboard_url(
     Returns:
         dict: Dashboard URL and monitoring information
     """
+    from handlers import handle_observability_get_dashboard_url
     return await handle_observability_get_dashboard_url({"region": region})
 
 
@@ -575,6 +622,7 @@ async def agentcore_observability_get_logs_info(
     Returns:
         dict: Log group name, agent ARN, and CLI commands
     """
+    from handlers import handle_observability_get_logs_info
     return await handle_observability_get_logs_info({
         "agent_arn": agent_arn,
         "region": region
@@ -602,6 +650,7 @@ async def agentcore_observability_get_recent_logs(
     Returns:
         dict: Recent log events with timestamps and messages
     """
+    from handlers import handle_observability_get_recent_logs
     return await handle_observability_get_recent_logs({
         "agent_arn": agent_arn,
         "hours_back": hours_back,
@@ -613,6 +662,9 @@ async def agentcore_observability_get_recent_logs(
 # ============================================================================
 # STRANDS AGENT CODE GENERATION TOOLS
 # ============================================================================
+# The generators only format strings (results are cached per argument set) and
+# make no AWS calls, so they are awaited directly rather than dispatched to a
+# thread pool; an executor hop would cost more than the work itself.
 
 @mcp.tool()
 async def generate_strands_agent(
@@ -659,6 +711,7 @@ async def generate_strands_agent(
             include_gateway=True
         )
     """
+    from handlers import handle_generate_strands_agent
     return await handle_generate_strands_agent({
         "agent_name": agent_name,
         "system_prompt": system_prompt,
@@ -707,6 +760,7 @@ async def generate_agentcore_runtime_agent(
     Returns:
         dict: Generated agent code with filename and instructions
     """
+    from handlers import handle_generate_agentcore_runtime_agent
     return await handle_generate_agentcore_runtime_agent({
         "agent_name": agent_name,
         "system_prompt": system_prompt,
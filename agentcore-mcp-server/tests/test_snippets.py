@@ -0,0 +1,15 @@
+import json
+
+from handlers._snippets import pretty_json
+
+
+def test_pretty_json_matches_json_dumps():
+    obj = {"prompt": "héllo", "items": [1, {"a": None}], "empty": {}}
+    assert pretty_json(obj) == json.dumps(obj, indent=4, ensure_ascii=False)
+    assert pretty_json(obj, 2) == json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def test_pretty_json_handles_ints_wider_than_64_bits():
+    obj = {"n": 2**64, "nested": [-(2**70)]}
+    assert pretty_json(obj) == json.dumps(obj, indent=4, ensure_ascii=False)
+    assert pretty_json(obj, 2) == json.dumps(obj, indent=2, ensure_ascii=False)
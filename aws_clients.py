@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Shared boto3 session and clients for the setup scripts.
+
+Clients are created lazily on first use and cached, so each script pays
+for credential resolution and service model loading only once. botocore
+itself only reads the model files of services a client is created for, and
+its loader caches them on the shared session.
+"""
+
+import time
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+REGION = "us-west-2"
+
+SESSION = boto3.session.Session(region_name=REGION)
+
+# Client configuration shared by every client created from SESSION
+# (keep-alive lets sequential calls reuse the pooled TLS connection; 20
+# connections covers the most concurrent callers, e.g. the parallel test runner)
+CLIENT_CONFIG = Config(
+    max_pool_connections=20,
+    tcp_keepalive=True,
+    connect_timeout=3,
+    retries={'max_attempts': 5, 'mode': 'adaptive'}
+)
+
+
+@lru_cache(maxsize=None)
+def get_client(service_name, region_name=REGION):
+    """Return a cached client for the given service and region"""
+    return SESSION.client(service_name, region_name=region_name, config=CLIENT_CONFIG)
+
+
+def iam():
+    """IAM client"""
+    return get_client('iam')
+
+
+def sts():
+    """STS client"""
+    return get_client('sts')
+
+
+def agentcore_control():
+    """Bedrock AgentCore control plane client"""
+    return get_client('bedrock-agentcore-control')
+
+
+# Backoff schedule (seconds) used while waiting for IAM changes to propagate
+IAM_PROPAGATION_DELAYS = (0.2, 0.4, 0.8, 1.6, 3.2, 5.0, 5.0)
+
+
+def wait_for_role_permission(role_arn, action_names, resource_arns, delays=IAM_PROPAGATION_DELAYS):
+    """Poll until the role's policies allow the given actions.
+
+    Returns True once IAM reports every action as allowed, or False if the
+    backoff schedule is exhausted first or the policy can't be simulated
+    (e.g. the caller lacks iam:SimulatePrincipalPolicy), so callers can fall
+    back to a fixed wait instead of failing.
+    """
+    for delay in delays:
+        try:
+            response = iam().simulate_principal_policy(
+                PolicySourceArn=role_arn,
+                ActionNames=action_names,
+                ResourceArns=resource_arns
+            )
+            results = response['EvaluationResults']
+            if results and all(r['EvalDecision'] == 'allowed' for r in results):
+                return True
+        except ClientError as e:
+            # A role that isn't visible yet is still propagating; anything
+            # else means the probe itself can't be used
+            if e.response['Error']['Code'] != 'NoSuchEntity':
+                return False
+        time.sleep(delay)
+    return False
+
+
+# Backoff schedule (seconds) for retrying calls on resources that are still propagating
+READY_RETRY_DELAYS = (0.5, 1.0, 2.0, 4.0, 5.0, 5.0, 5.0)
+
+
+def wait_ready(fn, error_codes, delays=READY_RETRY_DELAYS):
+    """Call fn(), retrying while it fails with one of the given error codes.
+
+    Used instead of a fixed sleep when a just-created resource (e.g. an IAM
+    role) may not be usable yet. Any other error, or the final attempt's
+    error, is raised as usual.
+    """
+    for delay in delays:
+        try:
+            return fn()
+        except ClientError as e:
+            if e.response['Error']['Code'] not in error_codes:
+                raise
+        time.sleep(delay)
+    return fn()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Helpers for loading the JSON configuration files written by the setup scripts.
+
+Uses orjson when it is installed and falls back to the standard library.
+Parsed files are memoized per process and re-read only when they change on disk.
+"""
+
+import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# path -> ((mtime_ns, size), parsed config)
+_cache = {}
+
+# Files at least this big are memory-mapped (orjson only; it parses any
+# buffer). Below it a plain read() is cheaper than setting up the mapping.
+MMAP_THRESHOLD = 1 << 20
+
+
+def loads(data):
+    """Parse JSON from str or bytes"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent=False):
+    """Serialize obj to a JSON string, falling back to str() for unknown types"""
+    if orjson:
+        # Non-str keys are stringified like json.dumps does; anything orjson
+        # still rejects (e.g. ints beyond 64 bits) goes through json below
+        option = (orjson.OPT_INDENT_2 if indent else 0) | orjson.OPT_NON_STR_KEYS
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+def _read_mapped(path, size):
+    """Parse a large file from a read-only mapping, prefaulted where supported"""
+    with open(path, 'rb') as f:
+        flags = mmap.MAP_PRIVATE | getattr(mmap, 'MAP_POPULATE', 0)
+        with mmap.mmap(f.fileno(), size, flags=flags, prot=mmap.PROT_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+def check_keys(config, path, required):
+    """Raise ValueError naming any required keys missing from config"""
+    missing = [key for key in required if key not in config]
+    if missing:
+        raise ValueError(f"{path} is missing required key(s): {', '.join(missing)}")
+
+
+def load_config(path, required=()):
+    """Load a single JSON configuration file.
+
+    The file is read as raw bytes in one call and parsed directly, skipping
+    the text-mode decode and file-object iteration json.load() would do
+    (very large files are parsed straight from a memory mapping instead).
+    Repeat loads of an unchanged file return the same cached dict, so copy
+    it before making changes that shouldn't be seen by other callers.
+    Keys listed in required are checked up front (see check_keys).
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _cache.get(path)
+    if hit and hit[0] == key:
+        config = hit[1]
+    else:
+        if orjson and st.st_size >= MMAP_THRESHOLD and hasattr(mmap, 'MAP_PRIVATE'):
+            config = _read_mapped(path, st.st_size)
+        else:
+            with open(path, 'rb') as f:
+                config = loads(f.read())
+        _cache[path] = (key, config)
+    check_keys(config, path, required)
+    return config
+
+
+def save_config(path, config):
+    """Write a configuration dict as indented JSON.
+
+    The data goes to a temporary file that then replaces the original, so
+    an interrupted write never leaves a truncated config behind.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(dumps(config, indent=True))
+    os.replace(tmp_path, path)
+    _cache.pop(path, None)
+
+
+def load_configs(paths):
+    """Load several JSON configuration files concurrently.
+
+    Returns a dict mapping each path to its parsed contents. Raises the
+    first error encountered (e.g. FileNotFoundError) after all reads finish.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(paths), 1)) as executor:
+        results = list(executor.map(load_config, paths))
+    return dict(zip(paths, results))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Local on-disk cache for AgentCore Memory retrievals and agent responses.
+
+Stores retrieve_memories responses and agent replies in a small SQLite
+database so repeated test runs don't hit the service again.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+DEFAULT_DB_PATH = ".memory_cache.db"
+
+
+def normalize_query(query):
+    """Normalize a query so trivially different spellings share a cache entry"""
+    return " ".join(query.lower().split())
+
+
+class CacheClient:
+    """SQLite-backed cache for memory retrieval results"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, ttl_s=3600):
+        self.ttl_s = ttl_s
+        # Shared with worker threads, so serialize access with a lock
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS cache_meta (
+                memory_id TEXT NOT NULL,
+                namespace TEXT NOT NULL,
+                query TEXT NOT NULL,
+                response_json TEXT NOT NULL,
+                inserted_at REAL NOT NULL,
+                PRIMARY KEY (memory_id, namespace, query)
+            )"""
+        )
+        self.conn.commit()
+
+    def get(self, memory_id, namespace, query):
+        """Return cached memories, or None on a miss or expired entry"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT response_json FROM cache_meta "
+                "WHERE memory_id = ? AND namespace = ? AND query = ? AND inserted_at > ?",
+                (memory_id, namespace, normalize_query(query), time.time() - self.ttl_s)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put(self, memory_id, namespace, query, response):
+        """Store memories returned by the service"""
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache_meta VALUES (?, ?, ?, ?, ?)",
+                (memory_id, namespace, normalize_query(query),
+                 json.dumps(response, default=str), time.time())
+            )
+            self.conn.commit()
+
+
+class AgentResponseCache:
+    """SQLite-backed cache for agent responses keyed by actor, session and input"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, ttl_s=3600):
+        self.ttl_s = ttl_s
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS agent_responses (
+                cache_key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                inserted_at REAL NOT NULL
+            )"""
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(actor_id, session_id, user_input):
+        """Hash the invocation arguments into a cache key"""
+        raw = "\0".join((actor_id, session_id, normalize_query(user_input)))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, actor_id, session_id, user_input):
+        """Return a cached response, or None on a miss or expired entry"""
+        row = self.conn.execute(
+            "SELECT response FROM agent_responses WHERE cache_key = ? AND inserted_at > ?",
+            (self.make_key(actor_id, session_id, user_input), time.time() - self.ttl_s)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, actor_id, session_id, user_input, response):
+        """Store an agent response"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO agent_responses VALUES (?, ?, ?)",
+            (self.make_key(actor_id, session_id, user_input), response, time.time())
+        )
+        self.conn.commit()